@@ -2,8 +2,6 @@
 Connector banner — uses shared console from shaper, keeps connector-specific displays.
 """
 
-from rich.panel import Panel
-
 # Use shared console so output is consistent with main shaper UI
 from shaper.banner import console
 from core import __version__
@@ -14,14 +12,22 @@ VERSION = f"v{__version__}"
 
 def show_banner():
     """Display connector header (no ASCII art — only main Signalis has that)."""
-    console.print()
-    console.print("[bold cyan]⚯ Connector[/bold cyan]")
-    console.print(f"[dim]{TAGLINE}[/dim]")
-    console.print()
+    from rich.console import Group
+
+    # One render/write instead of four separate console.print flushes
+    console.print(Group(
+        "",
+        "[bold cyan]⚯ Connector[/bold cyan]",
+        f"[dim]{TAGLINE}[/dim]",
+        "",
+    ))
 
 
 def show_welcome():
     """Show welcome message."""
+    from rich.padding import Padding
+    from rich.panel import Panel
+
     welcome = Panel(
         "[bold cyan]Welcome to Connector CLI![/bold cyan]\n\n"
         "This tool helps you:\n"
@@ -32,8 +38,7 @@ def show_welcome():
         border_style="cyan",
         padding=(1, 2)
     )
-    console.print(welcome)
-    console.print()
+    console.print(Padding(welcome, (0, 0, 1, 0)))
 
 
 def show_step(step_num: int, title: str, description: str = ""):
@@ -41,8 +46,7 @@ def show_step(step_num: int, title: str, description: str = ""):
     step_text = f"[bold cyan]Step {step_num}:[/bold cyan] [bold white]{title}[/bold white]"
     if description:
         step_text += f"\n[dim]{description}[/dim]"
-    console.print(step_text)
-    console.print()
+    console.print(step_text + "\n")
 
 
 def show_success(message: str):
@@ -67,6 +71,9 @@ def show_info(message: str):
 
 def show_results_summary(stats: dict):
     """Show results summary in a panel."""
+    from rich.padding import Padding
+    from rich.panel import Panel
+
     total_matches = stats.get('total_matches', 0)
     unique_demands = stats.get('unique_demands_matched', 0)
     avg_per_demand = total_matches / unique_demands if unique_demands > 0 else 0
@@ -84,5 +91,4 @@ def show_results_summary(stats: dict):
         border_style="green",
         padding=(1, 2)
     )
-    console.print()
-    console.print(summary)
+    console.print(Padding(summary, (1, 0, 0, 0)))
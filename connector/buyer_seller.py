@@ -9,129 +9,246 @@ SUPPLY TRUTH CONSTRAINT:
 - Custom mode bypasses validation (user responsibility)
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+import re
+from typing import Dict, FrozenSet, List, Optional, Tuple, Any
 
 
 # Token dictionaries per connector mode
 _MODE_TOKENS: Dict[str, Dict[str, Any]] = {
     'recruiting': {
-        'supply_buyer': [
+        'supply_buyer': (
             'hiring', 'talent acquisition', 'headcount', 'open roles', 'recruiting',
             'staffing', 'placement', 'executive search', 'hr', 'human resources',
-        ],
-        'demand_type': [
+        ),
+        'demand_type': (
             'hiring', 'growing team', 'scaling', 'open positions', 'headcount',
             'talent', 'recruiting', 'job posting',
-        ],
-        'disallowed_peers': [
+        ),
+        'disallowed_peers': (
             'staffing agency', 'recruitment firm', 'headhunter', 'talent agency',
-        ],
+        ),
         'default_buyer': 'hiring_teams',
         'default_demand': 'hiring_company',
     },
     'biotech_licensing': {
-        'supply_buyer': [
+        'supply_buyer': (
             'pharma', 'biotech', 'licensing', 'bd', 'business development',
             'partnership', 'clinical', 'pipeline', 'therapeutic', 'molecule',
-        ],
-        'demand_type': [
+        ),
+        'demand_type': (
             'biotech', 'pharma', 'clinical stage', 'therapeutics', 'drug',
             'molecule', 'pipeline', 'fda', 'trial',
-        ],
-        'disallowed_peers': ['cro', 'contract research', 'clinical trial services'],
+        ),
+        'disallowed_peers': ('cro', 'contract research', 'clinical trial services'),
         'default_buyer': 'pharma_bd_teams',
         'default_demand': 'biotech_company',
     },
     'wealth_management': {
-        'supply_buyer': [
+        'supply_buyer': (
             'hnw', 'high net worth', 'uhnw', 'family office', 'wealth',
             'private client', 'affluent', 'investor', 'estate',
-        ],
-        'demand_type': [
+        ),
+        'demand_type': (
             'ria', 'wealth', 'advisory', 'financial planning', 'fiduciary',
             'cfp', 'family office', 'private wealth',
-        ],
-        'disallowed_peers': [
+        ),
+        'disallowed_peers': (
             'wealth advisor', 'ria', 'financial planner', 'cfp', 'wealth management firm',
-        ],
+        ),
         'default_buyer': 'hnw_individuals',
         'default_demand': 'wealth_advisory_firm',
     },
     'real_estate_capital': {
-        'supply_buyer': [
+        'supply_buyer': (
             'developer', 'sponsor', 'operator', 'gp', 'real estate', 'property',
             'cre', 'commercial', 'multifamily', 'acquisition',
-        ],
-        'demand_type': [
+        ),
+        'demand_type': (
             'developer', 'sponsor', 'real estate', 'property', 'cre',
             'commercial', 'multifamily', 'development',
-        ],
-        'disallowed_peers': ['lender', 'debt fund', 'capital provider', 'equity fund'],
+        ),
+        'disallowed_peers': ('lender', 'debt fund', 'capital provider', 'equity fund'),
         'default_buyer': 're_developers',
         'default_demand': 're_sponsor',
     },
     'logistics': {
-        'supply_buyer': [
+        'supply_buyer': (
             'shipper', 'manufacturer', 'retailer', 'ecommerce', 'brand',
             'fulfillment', 'warehouse', 'distribution',
-        ],
-        'demand_type': [
+        ),
+        'demand_type': (
             'shipper', 'logistics', 'supply chain', '3pl', 'freight',
             'warehouse', 'fulfillment', 'distribution',
-        ],
-        'disallowed_peers': ['3pl', 'freight broker', 'logistics provider', 'warehouse operator'],
+        ),
+        'disallowed_peers': ('3pl', 'freight broker', 'logistics provider', 'warehouse operator'),
         'default_buyer': 'shippers',
         'default_demand': 'logistics_company',
     },
     'crypto': {
-        'supply_buyer': [
+        'supply_buyer': (
             'product', 'engineering', 'fintech', 'platform', 'exchange',
             'defi', 'protocol', 'web3', 'blockchain', 'crypto', 'payments',
             'compliance', 'kyc', 'aml',
-        ],
-        'demand_type': [
+        ),
+        'demand_type': (
             'crypto', 'blockchain', 'web3', 'defi', 'protocol', 'exchange',
             'token', 'nft', 'dao', 'fintech platform',
-        ],
-        'disallowed_peers': [
+        ),
+        'disallowed_peers': (
             'wealth', 'ria', 'financial advisor', 'wealth management',
             'family office', 'private wealth', 'investment advisor',
-        ],
+        ),
         'default_buyer': 'crypto_product_teams',
         'default_demand': 'crypto_platform',
     },
     'enterprise_partnerships': {
-        'supply_buyer': [
+        'supply_buyer': (
             'enterprise', 'b2b', 'saas', 'platform', 'integration',
             'partnership', 'vendor', 'solution', 'software',
-        ],
-        'demand_type': [
+        ),
+        'demand_type': (
             'enterprise', 'b2b', 'saas', 'platform', 'software', 'solution', 'vendor',
-        ],
-        'disallowed_peers': ['consultant', 'agency', 'implementation partner'],
+        ),
+        'disallowed_peers': ('consultant', 'agency', 'implementation partner'),
         'default_buyer': 'enterprise_teams',
         'default_demand': 'enterprise_company',
     },
     'custom': {
-        'supply_buyer': [],
-        'demand_type': [],
-        'disallowed_peers': [],
+        'supply_buyer': (),
+        'demand_type': (),
+        'disallowed_peers': (),
         'default_buyer': 'general',
         'default_demand': 'company',
     },
 }
 
 
-def _build_text(record, *fields: str) -> str:
-    """Build lowercase searchable text from record fields."""
-    parts = []
-    for field in fields:
-        val = getattr(record, field, '') or ''
-        if isinstance(val, list):
-            parts.append(' '.join(str(v) for v in val))
-        elif val:
-            parts.append(str(val))
-    return ' '.join(parts).lower()
+# Disallowed peers as frozensets for a direct disjointness test against
+# the scanned token set (the most selective filter, checked first)
+_MODE_DISALLOWED: Dict[str, FrozenSet[str]] = {
+    mode: frozenset(tokens['disallowed_peers'])
+    for mode, tokens in _MODE_TOKENS.items()
+}
+
+_WORD_SPLIT_RE = re.compile(r'\W+')
+
+
+class _ModeScanner:
+    """
+    Single-pass multi-token scanner, precomputed per connector mode.
+
+    Single-word tokens (the large majority of each mode dictionary) are
+    matched by splitting the text into words once and probing each word's
+    prefixes against a frozenset — O(|text|) regardless of dictionary
+    size. Prefix probing keeps inflected hits ('therapeutic' in
+    'therapeutics', 'pharma' in 'pharmaceutical') while dropping mid-word
+    false positives like 'hr' inside 'through'.
+
+    Multi-word phrases are folded into one compiled alternation
+    (longest-first, inside a lookahead so overlapping hits are not
+    swallowed) and scanned in a single linear pass. A precomputed
+    containment map expands phrase hits so that 'talent acquisition' also
+    reports embedded tokens like 'talent'.
+    """
+
+    __slots__ = ('_words', '_min_word_len', '_pattern', '_contained')
+
+    def __init__(self, token_lists: List[List[str]]):
+        all_tokens = sorted(
+            {t for tokens in token_lists for t in tokens},
+            key=len, reverse=True,
+        )
+        self._words = frozenset(t for t in all_tokens if ' ' not in t)
+        self._min_word_len = min((len(t) for t in self._words), default=1)
+
+        phrases = [t for t in all_tokens if ' ' in t]
+        if phrases:
+            alternation = '|'.join(re.escape(t) for t in phrases)
+            self._pattern = re.compile(f'(?=({alternation}))')
+        else:
+            self._pattern = None
+        # phrase -> tokens embedded in it (if t is in the text, so are these)
+        self._contained = {
+            t: [s for s in all_tokens if s != t and s in t]
+            for t in phrases
+        }
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """Return the set of mode tokens present in text."""
+        token_words = self._words
+        min_len = self._min_word_len
+        found = set()
+        for word in set(_WORD_SPLIT_RE.split(text)):
+            for end in range(min_len, len(word) + 1):
+                prefix = word[:end]
+                if prefix in token_words:
+                    found.add(prefix)
+        if self._pattern is None:
+            return frozenset(found)
+        for phrase in self._pattern.findall(text):
+            found.add(phrase)
+            found.update(self._contained[phrase])
+        return frozenset(found)
+
+
+_MODE_SCANNERS: Dict[str, _ModeScanner] = {
+    mode: _ModeScanner([
+        tokens['supply_buyer'], tokens['demand_type'], tokens['disallowed_peers'],
+    ])
+    for mode, tokens in _MODE_TOKENS.items()
+}
+
+
+# Token scans are pure functions of (record, mode), but matching calls
+# validate_match once per candidate pair — so each supply record would be
+# rescanned against every demand record (and vice versa). Cache scans per
+# record id for the duration of a matching run; the matcher resets the
+# cache when a new run starts.
+_SCAN_CACHE: Dict[Tuple[int, str, str], FrozenSet[str]] = {}
+
+
+def clear_scan_cache() -> None:
+    """Reset the per-record scan cache (called at the start of a matching run)."""
+    _SCAN_CACHE.clear()
+
+
+def _scan_record(record, side: str, mode: str) -> FrozenSet[str]:
+    """Return the mode tokens present in a record's searchable text, cached."""
+    key = (id(record), side, mode)
+    found = _SCAN_CACHE.get(key)
+    if found is None:
+        if side == 'supply':
+            text = _build_supply_text(record)
+        else:
+            text = _build_demand_text(record)
+        found = _MODE_SCANNERS[mode].scan(text)
+        _SCAN_CACHE[key] = found
+    return found
+
+
+def _industry_text(industry) -> str:
+    """Industry may arrive as a list from some schemas."""
+    if isinstance(industry, list):
+        return ' '.join(str(v) for v in industry)
+    return str(industry) if industry else ''
+
+
+def _build_supply_text(record) -> str:
+    """Lowercase searchable text for the supply side of a pair."""
+    return (
+        f"{record.company_description or ''} "
+        f"{_industry_text(record.industry)} "
+        f"{record.title or ''}"
+    ).lower()
+
+
+def _build_demand_text(record) -> str:
+    """Lowercase searchable text for the demand side of a pair."""
+    return (
+        f"{record.company_description or ''} "
+        f"{_industry_text(record.industry)} "
+        f"{record.signal or ''}"
+    ).lower()
 
 
 def _confidence(matched: List[str]) -> str:
@@ -142,8 +259,7 @@ def _confidence(matched: List[str]) -> str:
     return 'low'
 
 
-def _infer_buyer_type(tokens: List[str], mode: str, default: str) -> str:
-    t = set(tokens)
+def _infer_buyer_type(t: FrozenSet[str], mode: str, default: str) -> str:
     if mode == 'crypto':
         if 'product' in t or 'engineering' in t:
             return 'crypto_product_teams'
@@ -169,8 +285,7 @@ def _infer_buyer_type(tokens: List[str], mode: str, default: str) -> str:
     return default
 
 
-def _infer_demand_type(tokens: List[str], mode: str, default: str) -> str:
-    t = set(tokens)
+def _infer_demand_type(t: FrozenSet[str], mode: str, default: str) -> str:
     if mode == 'crypto':
         if 'exchange' in t:
             return 'crypto_exchange'
@@ -189,19 +304,35 @@ def _infer_demand_type(tokens: List[str], mode: str, default: str) -> str:
     return default
 
 
-def _check_mode_overlap(supply_tokens: List[str], demand_tokens: List[str], mode: str) -> bool:
+_WEALTH_WORDS = frozenset({'wealth', 'ria', 'advisor', 'family office', 'private wealth'})
+_PLATFORM_WORDS = frozenset({'crypto', 'blockchain', 'fintech platform', 'exchange'})
+
+
+def _check_mode_overlap(supply_tokens: FrozenSet[str], demand_tokens: FrozenSet[str], mode: str) -> bool:
     """Mode-specific cross-contamination rules."""
-    if mode == 'crypto':
-        wealth_words = {'wealth', 'ria', 'advisor', 'family office', 'private wealth'}
-        if any(t in wealth_words for t in supply_tokens):
-            return False
-    if mode == 'wealth_management':
-        platform_words = {'crypto', 'blockchain', 'fintech platform', 'exchange'}
-        if any(t in platform_words for t in demand_tokens):
-            return False
+    if mode == 'crypto' and not _WEALTH_WORDS.isdisjoint(supply_tokens):
+        return False
+    if mode == 'wealth_management' and not _PLATFORM_WORDS.isdisjoint(demand_tokens):
+        return False
     return True
 
 
+def prefilter_supply(supply_record, mode: str) -> bool:
+    """
+    Cheap per-supply reject that does not depend on the demand record.
+
+    Returns False when the supply record is a disallowed peer type for this
+    mode — such records fail validate_match against every demand record, so
+    matching code can call this once per supply row and skip the whole
+    demand loop on rejection.
+    """
+    if mode == 'custom' or mode not in _MODE_TOKENS:
+        return True
+
+    supply_found = _scan_record(supply_record, 'supply', mode)
+    return _MODE_DISALLOWED[mode].isdisjoint(supply_found)
+
+
 def validate_match(supply_record, demand_record, mode: str) -> Tuple[bool, Optional[str]]:
     """
     Validate buyer-seller overlap for a supply-demand pair.
@@ -221,16 +352,20 @@ def validate_match(supply_record, demand_record, mode: str) -> Tuple[bool, Optio
 
     tokens = _MODE_TOKENS[mode]
 
-    supply_text = _build_text(supply_record, 'company_description', 'industry', 'title')
-    demand_text = _build_text(demand_record, 'company_description', 'industry', 'signal')
+    # One cached linear pass per record instead of a scan per candidate pair.
+    # Check the supply side first: a disallowed peer rejects the pair without
+    # ever touching the demand record.
+    supply_found = _scan_record(supply_record, 'supply', mode)
 
     # Rule 1: Disallowed peer types on supply side
-    if any(peer in supply_text for peer in tokens['disallowed_peers']):
+    if not _MODE_DISALLOWED[mode].isdisjoint(supply_found):
         return False, 'BUYER_SELLER_MISMATCH'
 
+    demand_found = _scan_record(demand_record, 'demand', mode)
+
     # Rule 2: Extract buyer/demand tokens and confidence
-    supply_matched = [t for t in tokens['supply_buyer'] if t in supply_text]
-    demand_matched = [t for t in tokens['demand_type'] if t in demand_text]
+    supply_matched = supply_found.intersection(tokens['supply_buyer'])
+    demand_matched = demand_found.intersection(tokens['demand_type'])
 
     # Both low confidence → insufficient signal, allow
     if _confidence(supply_matched) == 'low' and _confidence(demand_matched) == 'low':
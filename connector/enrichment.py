@@ -5,14 +5,68 @@ Providers: SSM/ConnectorAgent → Apollo → Anymail (cascade order varies by ac
 SSM verify endpoint handles M365/catch-all detection internally.
 """
 
+import asyncio
+import functools
+import re
+import socket
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
+from requests.adapters import HTTPAdapter, Retry
+from urllib3.connection import HTTPConnection
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass
 
+from types import MappingProxyType
+
 from .models import NormalizedRecord, EnrichmentResult
-from .enrichment_cache import check_cache, store_in_cache
+from .enrichment_cache import (
+    check_cache, check_cache_many, store_in_cache, compute_cache_key,
+    flush_cache, _json_loads,
+)
+
+
+# Keepalive so pooled connections idling between batches aren't silently
+# dropped by NATs (guards: TCP_KEEPIDLE/KEEPINTVL are platform-specific)
+_SOCKET_OPTIONS = list(HTTPConnection.default_socket_options) + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, 'TCP_KEEPIDLE'):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60))
+if hasattr(socket, 'TCP_KEEPINTVL'):
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 30))
+
+# Connect timeout, separate from the per-provider read timeout: a provider
+# that can't even complete a handshake should fail fast so the waterfall
+# moves on instead of burning the whole read budget.
+_CONNECT_TIMEOUT = 3.0
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _make_session() -> requests.Session:
+    """Session with a connection pool so repeated calls to the same provider
+    reuse TCP+TLS connections instead of handshaking per request."""
+    session = requests.Session()
+    adapter = _KeepAliveAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# One pooled session per provider host; requests.Session is thread-safe for
+# the plain post/get usage below.
+_SSM_SESSION = _make_session()
+_APOLLO_SESSION = _make_session()
+_ANYMAIL_SESSION = _make_session()
 
 
 @dataclass
@@ -22,9 +76,19 @@ class EnrichmentConfig:
     anymail_api_key: Optional[str] = None
     ssm_api_key: Optional[str] = None
     timeout_ms: int = 30000
+    max_workers: int = 16  # batch concurrency; I/O-bound, so well above CPU count
+    # Call applicable find providers in parallel and take the first ENRICHED
+    # instead of the sequential waterfall. Faster, but consumes credits from
+    # every provider called, so it's opt-in.
+    race_providers: bool = False
 
 
-_cache_lock = threading.Lock()
+# Shared immutable inputs_present shapes: these exact dicts recur on most
+# result paths, so results reference one frozen mapping instead of
+# allocating a fresh dict per call site.
+_IP_EMAIL = MappingProxyType({'email': True})
+_IP_DOMAIN_NAME = MappingProxyType({'domain': True, 'person_name': True})
+_IP_DOMAIN_NO_NAME = MappingProxyType({'domain': True, 'person_name': False})
 
 
 # Seniority ranking for Apollo candidate selection. Higher = more senior.
@@ -52,12 +116,47 @@ SENIORITY_RANKS: Dict[str, int] = {
 }
 
 
+# Sorted once at import (highest rank first) so scoring a candidate doesn't
+# re-sort the table; the first keyword hit is already the best possible score.
+_SENIORITY_SORTED: List[tuple] = sorted(SENIORITY_RANKS.items(), key=lambda x: -x[1])
+
+# All keywords folded into one lookahead alternation (same trick as the
+# buyer/seller token scanner): one C-level pass over the title finds every
+# keyword occurrence, including overlapping ones like 'president' inside
+# 'vice president', instead of 21 separate substring scans.
+_SENIORITY_SCAN_RE = re.compile(
+    '(?=(' + '|'.join(re.escape(keyword) for keyword, _ in _SENIORITY_SORTED) + '))'
+)
+_TOP_RANK = _SENIORITY_SORTED[0][1]
+
+
+@functools.lru_cache(maxsize=4096)
+def _score_title(title: str) -> int:
+    best = 10
+    for match in _SENIORITY_SCAN_RE.finditer(title):
+        rank = SENIORITY_RANKS[match.group(1)]
+        if rank > best:
+            if rank == _TOP_RANK:
+                return rank
+            best = rank
+    return best
+
+
 def _score_person(person: Dict[str, Any]) -> int:
-    title = (person.get('title') or '').lower()
-    for keyword, score in sorted(SENIORITY_RANKS.items(), key=lambda x: -x[1]):
-        if keyword in title:
-            return score
-    return 10
+    # Memoized per lowercased title: Apollo pages repeat titles heavily
+    return _score_title((person.get('title') or '').lower())
+
+
+def _split_name(record: NormalizedRecord) -> tuple:
+    """(first, last) from record fields, falling back to one split of
+    full_name — providers were re-splitting the same string up to four
+    times per record."""
+    if record.first_name and record.last_name:
+        return record.first_name, record.last_name
+    parts = (record.full_name or '').split()
+    first = record.first_name or (parts[0] if parts else '')
+    last = record.last_name or (parts[1] if len(parts) > 1 else '')
+    return first, last
 
 
 def classify_inputs(record: NormalizedRecord) -> str:
@@ -109,32 +208,32 @@ def verify_with_ssm(
         return None
 
     try:
-        response = requests.post(
+        response = _SSM_SESSION.post(
             'https://api.connector-os.com/api/email/v2/verify',
             headers={
                 'Content-Type': 'application/json',
                 'Authorization': f'Bearer {api_key}',
             },
             json={'email': email},
-            timeout=timeout_ms / 1000
+            timeout=(_CONNECT_TIMEOUT, timeout_ms / 1000)
         )
 
         if response.status_code == 401:
             return EnrichmentResult(
                 action='VERIFY', outcome='AUTH_ERROR',
-                email=email, source='ssm', inputs_present={'email': True}
+                email=email, source='ssm', inputs_present=_IP_EMAIL
             )
 
         if response.status_code == 429:
             return EnrichmentResult(
                 action='VERIFY', outcome='RATE_LIMITED',
-                email=email, source='ssm', inputs_present={'email': True}
+                email=email, source='ssm', inputs_present=_IP_EMAIL
             )
 
         if response.status_code != 200:
             return None
 
-        data = response.json()
+        data = _json_loads(response.content)
         status = (data.get('status') or '').lower()
         verdict = (data.get('verdict') or '').upper()
 
@@ -151,21 +250,21 @@ def verify_with_ssm(
             return EnrichmentResult(
                 action='VERIFY', outcome='VERIFIED',
                 email=email, verified=True, source='ssm',
-                inputs_present={'email': True}, provider_results=provider_ctx
+                inputs_present=_IP_EMAIL, provider_results=provider_ctx
             )
 
         if status == 'risky':
             return EnrichmentResult(
                 action='VERIFY', outcome='VERIFIED',
                 email=email, verified=False, source='ssm',
-                inputs_present={'email': True}, provider_results=provider_ctx
+                inputs_present=_IP_EMAIL, provider_results=provider_ctx
             )
 
         if status == 'invalid' or verdict == 'INVALID':
             return EnrichmentResult(
                 action='VERIFY', outcome='INVALID',
                 email=email, verified=False, source='ssm',
-                inputs_present={'email': True}, provider_results=provider_ctx
+                inputs_present=_IP_EMAIL, provider_results=provider_ctx
             )
 
         return None  # unknown status — don't block
@@ -188,61 +287,57 @@ def enrich_with_ssm(
     if not api_key or not record.domain:
         return None
 
-    first_name = record.first_name or (record.full_name.split()[0] if record.full_name else '')
-    last_name = record.last_name or (
-        record.full_name.split()[1]
-        if record.full_name and len(record.full_name.split()) > 1 else ''
-    )
+    first_name, last_name = _split_name(record)
 
     if not first_name or not last_name:
         return EnrichmentResult(
             action='FIND_PERSON', outcome='MISSING_INPUT',
-            source='ssm', inputs_present={'domain': True, 'person_name': False}
+            source='ssm', inputs_present=_IP_DOMAIN_NO_NAME
         )
 
     try:
-        response = requests.post(
+        response = _SSM_SESSION.post(
             'https://api.connector-os.com/api/email/v2/find',
             headers={
                 'Content-Type': 'application/json',
                 'Authorization': f'Bearer {api_key}',
             },
             json={'firstName': first_name, 'lastName': last_name, 'domain': record.domain},
-            timeout=timeout_ms / 1000
+            timeout=(_CONNECT_TIMEOUT, timeout_ms / 1000)
         )
 
         if response.status_code == 401:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='AUTH_ERROR',
-                source='ssm', inputs_present={'domain': True, 'person_name': True}
+                source='ssm', inputs_present=_IP_DOMAIN_NAME
             )
 
         if response.status_code == 429:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='RATE_LIMITED',
-                source='ssm', inputs_present={'domain': True, 'person_name': True}
+                source='ssm', inputs_present=_IP_DOMAIN_NAME
             )
 
         if response.status_code != 200:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='NOT_FOUND',
-                source='ssm', inputs_present={'domain': True, 'person_name': True}
+                source='ssm', inputs_present=_IP_DOMAIN_NAME
             )
 
-        data = response.json()
+        data = _json_loads(response.content)
         email = data.get('email')
 
         if not email:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='NO_CANDIDATES',
-                source='ssm', inputs_present={'domain': True, 'person_name': True}
+                source='ssm', inputs_present=_IP_DOMAIN_NAME
             )
 
         return EnrichmentResult(
             action='FIND_PERSON', outcome='ENRICHED',
             email=email, first_name=first_name, last_name=last_name,
             title=record.title or '', verified=True, source='ssm',
-            inputs_present={'domain': True, 'person_name': True}
+            inputs_present=_IP_DOMAIN_NAME
         )
 
     except Exception:
@@ -280,11 +375,11 @@ def enrich_with_apollo(
         payload['q_keywords'] = record.company
 
     try:
-        response = requests.post(
+        response = _APOLLO_SESSION.post(
             'https://api.apollo.io/v1/mixed_people/search',
             headers={'Content-Type': 'application/json', 'X-Api-Key': api_key},
             json=payload,
-            timeout=timeout_ms / 1000
+            timeout=(_CONNECT_TIMEOUT, timeout_ms / 1000)
         )
 
         if response.status_code == 401:
@@ -311,27 +406,25 @@ def enrich_with_apollo(
                 source='apollo', inputs_present={'domain': has_domain, 'company': has_company}
             )
 
-        people = response.json().get('people', [])
+        people = _json_loads(response.content).get('people', [])
         if not people:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='NO_CANDIDATES',
                 source='apollo', inputs_present={'domain': has_domain, 'company': has_company}
             )
 
-        person = None
-        email = None
-        for candidate in sorted(people, key=_score_person, reverse=True):
-            if candidate.get('email'):
-                person = candidate
-                email = candidate['email']
-                break
-
-        if not email or not person:
+        # Only candidates with emails are usable, so score just those and
+        # take the max — no need to sort the whole page
+        candidates = [c for c in people if c.get('email')]
+        if not candidates:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='NO_CANDIDATES',
                 source='apollo', inputs_present={'domain': has_domain, 'company': has_company}
             )
 
+        person = max(candidates, key=_score_person)
+        email = person['email']
+
         return EnrichmentResult(
             action='FIND_PERSON', outcome='ENRICHED',
             email=email,
@@ -361,13 +454,10 @@ def enrich_with_anymail(
             source='none', inputs_present={'domain': bool(record.domain), 'person_name': False}
         )
 
-    first_name = record.first_name or record.full_name.split()[0]
-    last_name = record.last_name or (
-        record.full_name.split()[1] if len(record.full_name.split()) > 1 else ''
-    )
+    first_name, last_name = _split_name(record)
 
     try:
-        response = requests.get(
+        response = _ANYMAIL_SESSION.get(
             'https://api.anymailfinder.com/v5.0/search/person.json',
             params={
                 'api_key': api_key,
@@ -375,68 +465,110 @@ def enrich_with_anymail(
                 'first_name': first_name,
                 'last_name': last_name,
             },
-            timeout=timeout_ms / 1000
+            timeout=(_CONNECT_TIMEOUT, timeout_ms / 1000)
         )
 
         if response.status_code == 401:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='AUTH_ERROR',
-                source='anymail', inputs_present={'domain': True, 'person_name': True}
+                source='anymail', inputs_present=_IP_DOMAIN_NAME
             )
 
         if response.status_code == 429:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='RATE_LIMITED',
-                source='anymail', inputs_present={'domain': True, 'person_name': True}
+                source='anymail', inputs_present=_IP_DOMAIN_NAME
             )
 
         if response.status_code != 200:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='NOT_FOUND',
-                source='anymail', inputs_present={'domain': True, 'person_name': True}
+                source='anymail', inputs_present=_IP_DOMAIN_NAME
             )
 
-        data = response.json()
+        data = _json_loads(response.content)
         email = data.get('email')
 
         if not email or data.get('confidence', 0) < 50:
             return EnrichmentResult(
                 action='FIND_PERSON', outcome='NO_CANDIDATES',
-                source='anymail', inputs_present={'domain': True, 'person_name': True}
+                source='anymail', inputs_present=_IP_DOMAIN_NAME
             )
 
         return EnrichmentResult(
             action='FIND_PERSON', outcome='ENRICHED',
             email=email, first_name=first_name, last_name=last_name,
             title=record.title or '', verified=True, source='anymail',
-            inputs_present={'domain': True, 'person_name': True}
+            inputs_present=_IP_DOMAIN_NAME
         )
 
     except Exception:
         return None
 
 
+# Provider waterfall order per action type, built once at import. API keys
+# come from the config at call time via _KEY_ATTR.
+_FIND_TABLE = {
+    'FIND_PERSON':          (('anymail', enrich_with_anymail), ('ssm', enrich_with_ssm), ('apollo', enrich_with_apollo)),
+    'FIND_COMPANY_CONTACT': (('apollo', enrich_with_apollo), ('anymail', enrich_with_anymail)),
+    'SEARCH_PERSON':        (('anymail', enrich_with_anymail), ('apollo', enrich_with_apollo)),
+    'SEARCH_COMPANY':       (('apollo', enrich_with_apollo), ('anymail', enrich_with_anymail)),
+}
+_KEY_ATTR = {
+    'anymail': 'anymail_api_key',
+    'apollo': 'apollo_api_key',
+    'ssm': 'ssm_api_key',
+}
+
+
 def _get_find_providers(config: EnrichmentConfig, action: str):
-    """
-    Provider waterfall order per action type.
+    """Resolve the action's waterfall to (name, func, api_key) tuples."""
+    return [
+        (name, func, getattr(config, _KEY_ATTR[name]))
+        for name, func in _FIND_TABLE.get(action, _FIND_TABLE['SEARCH_COMPANY'])
+    ]
+
 
-    FIND_PERSON:          anymail → ssm → apollo
-    FIND_COMPANY_CONTACT: apollo  → anymail
-    SEARCH_PERSON:        anymail → apollo
-    SEARCH_COMPANY:       apollo  → anymail
+def _waterfall_find_providers(record, providers, timeout_ms) -> Optional[EnrichmentResult]:
+    """Try providers in order; return the first ENRICHED result.
+
+    AUTH_ERROR/CREDITS_EXHAUSTED abort the waterfall — later providers
+    can't fix a bad key and retrying burns the remaining budget.
     """
-    anymail = ('anymail', enrich_with_anymail, config.anymail_api_key)
-    apollo  = ('apollo',  enrich_with_apollo,  config.apollo_api_key)
-    ssm     = ('ssm',     enrich_with_ssm,     config.ssm_api_key)
+    for _, provider_func, api_key in providers:
+        result = provider_func(record, api_key, timeout_ms)
+
+        if result and result.outcome == 'ENRICHED':
+            return result
+
+        if result and result.outcome in ('AUTH_ERROR', 'CREDITS_EXHAUSTED'):
+            return None
+
+    return None
+
 
-    if action == 'FIND_PERSON':
-        return [anymail, ssm, apollo]
-    elif action == 'FIND_COMPANY_CONTACT':
-        return [apollo, anymail]
-    elif action == 'SEARCH_PERSON':
-        return [anymail, apollo]
-    else:  # SEARCH_COMPANY
-        return [apollo, anymail]
+def _race_find_providers(record, providers, timeout_ms) -> Optional[EnrichmentResult]:
+    """Call every provider at once; first ENRICHED wins, the rest are
+    cancelled (already-running calls finish but are discarded)."""
+    with ThreadPoolExecutor(max_workers=len(providers)) as executor:
+        futures = [
+            executor.submit(provider_func, record, api_key, timeout_ms)
+            for _, provider_func, api_key in providers
+        ]
+
+        winner = None
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception:
+                continue
+            if result and result.outcome == 'ENRICHED':
+                winner = result
+                for pending in futures:
+                    pending.cancel()
+                break
+
+    return winner
 
 
 def enrich_record(record: NormalizedRecord, config: EnrichmentConfig) -> EnrichmentResult:
@@ -459,7 +591,7 @@ def enrich_record(record: NormalizedRecord, config: EnrichmentConfig) -> Enrichm
             action='VERIFY', outcome='ENRICHED',
             email=record.email, first_name=record.first_name,
             last_name=record.last_name, title=record.title or '',
-            verified=True, source='existing', inputs_present={'email': True}
+            verified=True, source='existing', inputs_present=_IP_EMAIL
         )
 
     if action == 'CANNOT_ROUTE':
@@ -474,8 +606,10 @@ def enrich_record(record: NormalizedRecord, config: EnrichmentConfig) -> Enrichm
             }
         )
 
-    with _cache_lock:
-        cached = check_cache(record)
+    # check_cache/store_in_cache are thread-safe (in-memory dict + append log).
+    # Compute the key once here; it is reused for the store after enrichment.
+    cache_key = compute_cache_key(record)
+    cached = check_cache(record, cache_key)
 
     if cached:
         record.email = cached.email
@@ -487,26 +621,23 @@ def enrich_record(record: NormalizedRecord, config: EnrichmentConfig) -> Enrichm
             record.title = cached.title
         return cached
 
-    for _, provider_func, api_key in _get_find_providers(config, action):
-        if not api_key:
-            continue
-
-        result = provider_func(record, api_key, config.timeout_ms)
+    providers = [p for p in _get_find_providers(config, action) if p[2]]
 
-        if result and result.outcome == 'ENRICHED':
-            record.email = result.email
-            if result.first_name:
-                record.first_name = result.first_name
-            if result.last_name:
-                record.last_name = result.last_name
-            if result.title:
-                record.title = result.title
-            with _cache_lock:
-                store_in_cache(record, result)
-            return result
-
-        if result and result.outcome in ('AUTH_ERROR', 'CREDITS_EXHAUSTED'):
-            break
+    if config.race_providers and len(providers) > 1:
+        result = _race_find_providers(record, providers, config.timeout_ms)
+    else:
+        result = _waterfall_find_providers(record, providers, config.timeout_ms)
+
+    if result:
+        record.email = result.email
+        if result.first_name:
+            record.first_name = result.first_name
+        if result.last_name:
+            record.last_name = result.last_name
+        if result.title:
+            record.title = result.title
+        store_in_cache(record, result, cache_key)
+        return result
 
     return EnrichmentResult(
         action=action, outcome='NOT_FOUND', source='none',
@@ -518,30 +649,141 @@ def enrich_record(record: NormalizedRecord, config: EnrichmentConfig) -> Enrichm
     )
 
 
+async def enrich_record_async(
+    record: NormalizedRecord,
+    config: EnrichmentConfig
+) -> EnrichmentResult:
+    """Async wrapper around enrich_record.
+
+    The provider calls stay on the pooled requests sessions; the event loop
+    hands them to its default executor so coroutine callers never block.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, enrich_record, record, config)
+
+
+async def enrich_batch_async(
+    records: List[NormalizedRecord],
+    config: EnrichmentConfig,
+    on_progress: Optional[callable] = None,
+    concurrency: int = 32,
+) -> Dict[str, EnrichmentResult]:
+    """
+    Enrich records from an event loop, bounded by a semaphore.
+
+    Useful for callers already running asyncio (e.g. alongside the exa
+    services); concurrency can go well past the thread-pool default since
+    each in-flight record only occupies an executor slot while its HTTP
+    call is outstanding. Sync callers should use enrich_batch.
+    """
+    results: Dict[str, EnrichmentResult] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+    total = len(records)
+    completed = 0
+
+    async def _enrich_one(record: NormalizedRecord) -> None:
+        nonlocal completed
+        async with semaphore:
+            result = await enrich_record_async(record, config)
+        results[record.record_key] = result
+        completed += 1
+        if on_progress:
+            on_progress(completed, total)
+
+    await asyncio.gather(*(_enrich_one(record) for record in records))
+    return results
+
+
+def _dedupe_key(record: NormalizedRecord) -> tuple:
+    """Every record field that influences classification or a provider call.
+
+    Records identical on these enrich identically, so a batch only needs to
+    hit the providers once per distinct tuple. Deliberately NOT the cache
+    key — that starts with record_key, which is unique per CSV row.
+    """
+    return (
+        record.email, record.domain, record.company,
+        record.full_name, record.first_name, record.last_name,
+        record.title, record.linkedin,
+    )
+
+
 def enrich_batch(
     records: List[NormalizedRecord],
     config: EnrichmentConfig,
     on_progress: Optional[callable] = None
 ) -> Dict[str, EnrichmentResult]:
-    """Enrich multiple records in parallel (max 3 concurrent API calls)."""
+    """Enrich multiple records in parallel (config.max_workers concurrent calls).
+
+    Duplicate rows (same enrichment inputs) are enriched once and the result
+    fanned out to every record in the bucket.
+    """
     results: Dict[str, EnrichmentResult] = {}
+    # Completions are drained on the calling thread by as_completed, so the
+    # counter and on_progress need no lock — workers never touch either.
     completed = 0
-    progress_lock = threading.Lock()
     total = len(records)
 
-    def _enrich_one(record: NormalizedRecord):
-        return record.record_key, enrich_record(record, config)
-
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {executor.submit(_enrich_one, record): record for record in records}
+    # Resolve cache hits up front in one pass over the in-memory cache, so
+    # workers only ever see records that actually need a provider. Only
+    # find/search actions consult the cache (mirrors enrich_record).
+    cacheable = [
+        record for record in records
+        if classify_inputs(record) not in ('VERIFY', 'CANNOT_ROUTE')
+    ]
+    hits = check_cache_many(cacheable)
+    for record in cacheable:
+        result = hits.get(record.record_key)
+        if result is None:
+            continue
+        results[record.record_key] = result
+        record.email = result.email
+        if result.first_name:
+            record.first_name = result.first_name
+        if result.last_name:
+            record.last_name = result.last_name
+        if result.title:
+            record.title = result.title
+
+    completed = len(results)
+    if on_progress and completed:
+        on_progress(completed, total)
+
+    # Bucket duplicates; only the first record of each bucket hits providers
+    buckets: Dict[tuple, List[NormalizedRecord]] = {}
+    for record in records:
+        if record.record_key not in results:
+            buckets.setdefault(_dedupe_key(record), []).append(record)
+
+    with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+        futures = {
+            executor.submit(enrich_record, bucket[0], config): bucket
+            for bucket in buckets.values()
+        }
 
         for future in as_completed(futures):
-            record_key, result = future.result()
-            results[record_key] = result
-
+            bucket = futures[future]
+            result = future.result()
+
+            results[bucket[0].record_key] = result
+            # Propagate to duplicates the same way enrich_record updates
+            # its own record
+            for duplicate in bucket[1:]:
+                results[duplicate.record_key] = result
+                if result.email:
+                    duplicate.email = result.email
+                if result.first_name:
+                    duplicate.first_name = result.first_name
+                if result.last_name:
+                    duplicate.last_name = result.last_name
+                if result.title:
+                    duplicate.title = result.title
+
+            completed += len(bucket)
             if on_progress:
-                with progress_lock:
-                    completed += 1
-                    on_progress(completed, total)
+                on_progress(completed, total)
+
+    # Compact this batch's log appends into the snapshot in one atomic write
+    flush_cache()
 
     return results
@@ -4,22 +4,59 @@ Enrichment Cache - File-based caching for enriched contacts
 Uses JSON file for simplicity. 90-day TTL.
 """
 
+import functools
 import json
 import hashlib
+import os
+import re
+import threading
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from dataclasses import dataclass, asdict
 
-from .models import NormalizedRecord, EnrichmentResult
+# Optional fast JSON — orjson decodes/encodes these dict-heavy payloads
+# several times faster than stdlib json when available
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+from types import MappingProxyType
+
+from .models import NormalizedRecord, EnrichmentResult, _SLOTS
+
+# Shared immutable inputs_present marker for cache hits (see enrichment.py)
+_IP_CACHED = MappingProxyType({'cached': True})
+
+
+def _json_loads(data):
+    return orjson.loads(data) if HAS_ORJSON else json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
 
 
 # Cache settings
 CACHE_FILE = Path.home() / '.signalis' / 'enrichment_cache.json'
+CACHE_LOG_FILE = CACHE_FILE.with_suffix('.jsonl')  # append-only write log
 CACHE_TTL_DAYS = 90  # 90-day TTL like original
+_TTL_SECONDS = CACHE_TTL_DAYS * 86400
+
+# In-memory view of the cache, loaded once per process. Reads are plain dict
+# lookups; writes update the dict and append one line to the JSONL log, so a
+# batch of N enrichments costs N appends instead of N full-file rewrites.
+_CACHE: Optional[Dict[str, 'CachedContact']] = None
+_load_lock = threading.Lock()
+_log_lock = threading.Lock()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CachedContact:
     """Cached enrichment result"""
     email: str
@@ -27,7 +64,7 @@ class CachedContact:
     last_name: str = ""
     title: str = ""
     source: str = ""
-    enriched_at: str = ""  # ISO timestamp
+    enriched_at: float = 0.0  # unix timestamp (legacy ISO strings migrated on load)
     verified: bool = False
 
 
@@ -68,80 +105,146 @@ def compute_cache_key(record: NormalizedRecord) -> str:
     return f"x:{hash_val}"
 
 
+# Keep alphanumeric + dash, drop the rest ([^\w-] plus \w's underscore);
+# collapse dash runs. Existing cache keys depend on these exact semantics.
+_SLUG_STRIP_RE = re.compile(r'[^\w-]|_')
+_SLUG_DASHES_RE = re.compile(r'-{2,}')
+
+
+@functools.lru_cache(maxsize=8192)
 def slugify(text: str) -> str:
-    """Convert text to slug (lowercase, alphanumeric, spaces->dashes)"""
-    # Lowercase
-    slug = text.lower()
-    # Replace spaces with dashes
-    slug = slug.replace(' ', '-')
-    # Keep only alphanumeric and dashes
-    slug = ''.join(c for c in slug if c.isalnum() or c == '-')
-    # Remove duplicate dashes
-    while '--' in slug:
-        slug = slug.replace('--', '-')
-    # Trim dashes
-    slug = slug.strip('-')
-    # Max 50 chars
+    """Convert text to slug (lowercase, alphanumeric, spaces->dashes).
+
+    Memoized: company/person names repeat heavily within a batch."""
+    slug = _SLUG_STRIP_RE.sub('', text.lower().replace(' ', '-'))
+    slug = _SLUG_DASHES_RE.sub('-', slug).strip('-')
     return slug[:50]
 
 
 def simple_hash(text: str) -> str:
     """Simple deterministic hash for cache keys"""
-    # Use MD5 for deterministic hashing (not cryptographic use)
-    return hashlib.md5(text.encode()).hexdigest()[:8]
-
+    # blake2b with a 4-byte digest gives the same 8 hex chars as the old
+    # truncated MD5 with less per-call overhead (not cryptographic use)
+    return hashlib.blake2b(text.encode(), digest_size=4).hexdigest()
 
-def load_cache() -> Dict[str, CachedContact]:
-    """Load cache from file"""
-    if not CACHE_FILE.exists():
-        return {}
 
+def _coerce_enriched_at(value: Any) -> float:
+    """Migrate legacy ISO-string timestamps to unix seconds on read"""
+    if isinstance(value, (int, float)):
+        return float(value)
     try:
-        with open(CACHE_FILE, 'r') as f:
-            data = json.load(f)
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).timestamp()
+    except Exception:
+        return 0.0  # unparseable → treated as stale
 
-        # Convert to CachedContact objects
-        cache = {}
-        for key, value in data.items():
-            cache[key] = CachedContact(**value)
 
-        return cache
-    except Exception:
-        return {}
+def load_cache() -> Dict[str, CachedContact]:
+    """Load cache from disk: JSON snapshot, then replay the append-only log"""
+    cache: Dict[str, CachedContact] = {}
+
+    if CACHE_FILE.exists():
+        try:
+            with open(CACHE_FILE, 'rb') as f:
+                data = _json_loads(f.read())
+            for key, value in data.items():
+                value['enriched_at'] = _coerce_enriched_at(value.get('enriched_at', 0.0))
+                cache[key] = CachedContact(**value)
+        except Exception:
+            pass
+
+    # Replay log entries on top of the snapshot (last write per key wins)
+    if CACHE_LOG_FILE.exists():
+        try:
+            with open(CACHE_LOG_FILE, 'r') as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = _json_loads(line)
+                        for key, value in entry.items():
+                            value['enriched_at'] = _coerce_enriched_at(value.get('enriched_at', 0.0))
+                            cache[key] = CachedContact(**value)
+                    except Exception:
+                        continue  # skip torn/corrupt lines
+        except Exception:
+            pass
+
+    return cache
+
+
+def _load_once() -> Dict[str, CachedContact]:
+    """Return the process-wide cache dict, loading from disk on first use"""
+    global _CACHE
+    if _CACHE is None:
+        with _load_lock:
+            if _CACHE is None:
+                _CACHE = load_cache()
+    return _CACHE
 
 
 def save_cache(cache: Dict[str, CachedContact]) -> None:
-    """Save cache to file"""
+    """Save cache to file (atomic: temp file + rename)"""
     # Create directory if needed
     CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
 
     # Convert to dict
     data = {key: asdict(contact) for key, contact in cache.items()}
 
-    # Write to file
-    with open(CACHE_FILE, 'w') as f:
-        json.dump(data, f, indent=2)
+    # Write compact (the cache is machine-read only) to a temp file, then
+    # rename over the snapshot so a crash never leaves it half-written
+    tmp = CACHE_FILE.with_suffix('.tmp')
+    with open(tmp, 'w') as f:
+        f.write(_json_dumps(data))
+    os.replace(tmp, CACHE_FILE)
+
 
+def flush_cache() -> None:
+    """Compact the in-memory cache into the snapshot and clear the log.
 
-def is_cache_stale(enriched_at: str) -> bool:
+    Called at batch boundaries; between flushes durability comes from the
+    per-store log appends, so losing the flush only costs a replay on the
+    next load.
+    """
+    if _CACHE is None:
+        return  # nothing was loaded or stored this process
+
+    with _log_lock:
+        save_cache(_CACHE)
+        if CACHE_LOG_FILE.exists():
+            CACHE_LOG_FILE.unlink()
+
+
+def format_iso(enriched_at: float) -> str:
+    """Render an epoch timestamp as UTC ISO-8601 for display.
+
+    Only used off the hot path (CLI output); storage and staleness checks
+    stay on plain floats.
+    """
+    return datetime.fromtimestamp(enriched_at, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def is_cache_stale(enriched_at: float) -> bool:
     """Check if cache entry is stale (>90 days old)"""
-    try:
-        enriched_time = datetime.fromisoformat(enriched_at.replace('Z', '+00:00'))
-        age = datetime.now(enriched_time.tzinfo) - enriched_time
-        return age > timedelta(days=CACHE_TTL_DAYS)
-    except Exception:
-        return True  # Treat invalid timestamps as stale
+    # Epoch comparison: a float subtraction instead of ISO parsing per check.
+    # Unparseable legacy values were coerced to 0.0 on load, i.e. stale.
+    return (time.time() - enriched_at) > _TTL_SECONDS
 
 
-def check_cache(record: NormalizedRecord) -> Optional[EnrichmentResult]:
+def check_cache(
+    record: NormalizedRecord,
+    cache_key: Optional[str] = None,
+) -> Optional[EnrichmentResult]:
     """
     Check cache for existing enrichment result.
     Returns cached result if found and not stale.
-    """
-    cache_key = compute_cache_key(record)
-    cache = load_cache()
 
-    cached = cache.get(cache_key)
+    Callers that already computed the record's key can pass it to skip
+    recomputing the slug/hash chain.
+    """
+    if cache_key is None:
+        cache_key = compute_cache_key(record)
+    cached = _load_once().get(cache_key)
     if not cached:
         return None
 
@@ -149,7 +252,11 @@ def check_cache(record: NormalizedRecord) -> Optional[EnrichmentResult]:
     if is_cache_stale(cached.enriched_at):
         return None
 
-    # Return as EnrichmentResult
+    return _to_result(cached)
+
+
+def _to_result(cached: CachedContact) -> EnrichmentResult:
+    """Present a cache entry as an EnrichmentResult"""
     return EnrichmentResult(
         action='VERIFY',
         outcome='ENRICHED',
@@ -158,11 +265,36 @@ def check_cache(record: NormalizedRecord) -> Optional[EnrichmentResult]:
         first_name=cached.first_name,
         last_name=cached.last_name,
         title=cached.title,
-        inputs_present={'cached': True}
+        inputs_present=_IP_CACHED
     )
 
 
-def store_in_cache(record: NormalizedRecord, result: EnrichmentResult) -> None:
+def check_cache_many(records) -> Dict[str, EnrichmentResult]:
+    """
+    Resolve cache hits for many records in one pass.
+
+    Loads the cache once and probes the in-memory dict directly, so a batch
+    pays a single load instead of a per-record lookup inside each worker.
+    Returns fresh hits keyed by record_key.
+    """
+    cache = _load_once()
+    hits: Dict[str, EnrichmentResult] = {}
+    if not cache:
+        return hits
+
+    cutoff = time.time() - _TTL_SECONDS
+    for record in records:
+        cached = cache.get(compute_cache_key(record))
+        if cached and cached.enriched_at > cutoff:
+            hits[record.record_key] = _to_result(cached)
+    return hits
+
+
+def store_in_cache(
+    record: NormalizedRecord,
+    result: EnrichmentResult,
+    cache_key: Optional[str] = None,
+) -> None:
     """
     Store enrichment result in cache.
     Only stores successful enrichments with emails.
@@ -179,11 +311,9 @@ def store_in_cache(record: NormalizedRecord, result: EnrichmentResult) -> None:
     if result.source in ['none', 'existing']:
         return
 
-    # Generate cache key
-    cache_key = compute_cache_key(record)
-
-    # Load current cache
-    cache = load_cache()
+    # Generate cache key (unless the caller already has it)
+    if cache_key is None:
+        cache_key = compute_cache_key(record)
 
     # Create cached contact
     cached = CachedContact(
@@ -192,26 +322,32 @@ def store_in_cache(record: NormalizedRecord, result: EnrichmentResult) -> None:
         last_name=result.last_name or record.last_name or "",
         title=result.title or record.title or "",
         source=result.source,
-        enriched_at=datetime.utcnow().isoformat() + 'Z',
+        enriched_at=time.time(),
         verified=result.outcome == 'VERIFIED'
     )
 
-    # Store in cache
-    cache[cache_key] = cached
-
-    # Save to file
-    save_cache(cache)
+    # Update in memory and append one line to the log (not a full rewrite)
+    _load_once()[cache_key] = cached
+    line = _json_dumps({cache_key: asdict(cached)})
+    with _log_lock:
+        CACHE_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(CACHE_LOG_FILE, 'a') as f:
+            f.write(line + '\n')
 
 
 def clear_cache() -> None:
     """Clear the entire enrichment cache"""
+    global _CACHE
     if CACHE_FILE.exists():
         CACHE_FILE.unlink()
+    if CACHE_LOG_FILE.exists():
+        CACHE_LOG_FILE.unlink()
+    _CACHE = None
 
 
 def get_cache_stats() -> Dict[str, Any]:
     """Get cache statistics"""
-    cache = load_cache()
+    cache = _load_once()
 
     total = len(cache)
     stale = sum(1 for c in cache.values() if is_cache_stale(c.enriched_at))
@@ -14,7 +14,7 @@ from .models import (
     NeedProfile, CapabilityProfile, DemandRecord, SupplyRecord
 )
 from .semantic_expansion import get_semantic_score
-from .buyer_seller import validate_match
+from .buyer_seller import validate_match, prefilter_supply, clear_scan_cache
 
 
 # =============================================================================
@@ -774,8 +774,20 @@ def match_records(
     all_matches: List[Match] = []
     buyer_seller_filtered = 0
 
+    # Token scans in validate_match are cached per record for this run
+    clear_scan_cache()
+
+    # Disallowed-peer supplies fail validation against every demand record;
+    # reject them once up front instead of once per pair.
+    valid_supply = []
+    for s in supply:
+        if prefilter_supply(s, mode):
+            valid_supply.append(s)
+        else:
+            buyer_seller_filtered += len(demand)
+
     for i, d in enumerate(demand):
-        for s in supply:
+        for s in valid_supply:
             match = score_match(d, s, mode)
 
             # SUPPLY TRUTH CONSTRAINT: filter buyer-seller mismatches
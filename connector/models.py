@@ -4,12 +4,17 @@ Data models for Connector CLI
 Python port of connector-os schemas
 """
 
-from typing import Optional, Dict, Any, List, Literal
+import sys
+from typing import Optional, Dict, Any, List, Literal, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 fall back to plain dataclasses.
+# Applied to every per-row model below; nothing assigns undeclared attributes.
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SignalMeta:
     """Signal metadata from CSV"""
     kind: Literal['HIRING_ROLE', 'GROWTH', 'CONTACT_ROLE']
@@ -17,9 +22,15 @@ class SignalMeta:
     source: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NormalizedRecord:
-    """Normalized record structure - matches TypeScript NormalizedRecord"""
+    """
+    Normalized record structure - matches TypeScript NormalizedRecord
+
+    Slotted: one instance exists per CSV row, so dropping the per-instance
+    __dict__ saves ~200 bytes/record and speeds up the attribute reads in
+    the matching hot path.
+    """
 
     # Identity
     record_key: str
@@ -65,7 +76,7 @@ class NormalizedRecord:
     raw: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DemandRecord:
     """Demand record for matching - matches TypeScript DemandRecord"""
     domain: str
@@ -78,7 +89,7 @@ class DemandRecord:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SupplyRecord:
     """Supply record for matching - matches TypeScript SupplyRecord"""
     domain: str
@@ -91,7 +102,7 @@ class SupplyRecord:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Edge:
     """Edge/connection between demand and supply"""
     evidence: str
@@ -99,7 +110,7 @@ class Edge:
     signals: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NeedProfile:
     """Need profile extracted from demand - matches TypeScript NeedProfile"""
     category: str  # engineering, sales, marketing, biotech, healthcare, etc.
@@ -108,7 +119,7 @@ class NeedProfile:
     source: str = 'none'
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CapabilityProfile:
     """Capability profile extracted from supply - matches TypeScript CapabilityProfile"""
     category: str  # recruiting, marketing, engineering, biotech_contact, etc.
@@ -117,7 +128,7 @@ class CapabilityProfile:
     source: str = 'none'
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Match:
     """Match between demand and supply records"""
     demand: NormalizedRecord
@@ -132,7 +143,7 @@ class Match:
     narrative: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MatchingResult:
     """Result of matching operation"""
     demand_matches: List[Match]
@@ -140,7 +151,7 @@ class MatchingResult:
     stats: Dict[str, Any]
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EnrichmentResult:
     """Result of enrichment operation"""
     action: str
@@ -151,7 +162,9 @@ class EnrichmentResult:
     title: str = ""
     verified: bool = False
     source: str = "none"
-    inputs_present: Dict[str, bool] = field(default_factory=dict)
+    # Mapping, not Dict: shared immutable shapes (MappingProxyType) are
+    # passed by reference for the recurring cases
+    inputs_present: Mapping[str, bool] = field(default_factory=dict)
     providers_attempted: List[str] = field(default_factory=list)
     provider_results: Dict[str, Any] = field(default_factory=dict)
     duration_ms: float = 0.0
@@ -4,6 +4,8 @@ Centralized configuration management
 """
 
 import os
+import threading
+from functools import cached_property
 from pathlib import Path
 from typing import Optional, Dict, Any
 from dotenv import load_dotenv
@@ -11,18 +13,30 @@ from dotenv import load_dotenv
 from ._version import __version__
 
 
+# Parse .env once per process — load_dotenv re-reads and re-allocates the
+# whole file on every call. reload_config resets the flag.
+_DOTENV_LOADED = False
+
+
 class ShaperConfig:
     """
     Centralized configuration for Signalis.
     Loads from .env and provides typed access to all settings.
+
+    Env-derived settings are cached properties: each is read from the
+    environment once, on first access, instead of eagerly at construction.
     """
 
     def __init__(self, env_file: Optional[Path] = None):
+        global _DOTENV_LOADED
+
         if env_file is None:
             env_file = Path(__file__).parent.parent / '.env'
 
-        if env_file.exists():
-            load_dotenv(env_file)
+        if not _DOTENV_LOADED:
+            if env_file.exists():
+                load_dotenv(env_file)
+            _DOTENV_LOADED = True
 
         # Framework settings
         self.framework_name = "Signalis"
@@ -31,49 +45,72 @@ class ShaperConfig:
         # Paths
         self.root_dir = Path(__file__).parent.parent
 
-        # Output directory from .env or default
+    @cached_property
+    def output_dir(self) -> Path:
+        # Output directory from .env or default, created on first use
         output_dir_env = os.getenv('OUTPUT_DIR', 'output')
         if Path(output_dir_env).is_absolute():
-            self.output_dir = Path(output_dir_env)
+            output_dir = Path(output_dir_env)
         else:
-            self.output_dir = self.root_dir / output_dir_env
+            output_dir = self.root_dir / output_dir_env
 
-        self.shaper_output_dir = self.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        return output_dir
 
-        # Ensure output directory exists
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        # API Keys - Apify
-        self.apify_api_token = os.getenv('APIFY_API_TOKEN', '')
-
-        # API Keys - AI Providers (for Exa signal synthesis)
-        self.ai_provider = os.getenv('AI_PROVIDER', 'openai')
-        self.openai_api_key = os.getenv('OPENAI_API_KEY', '')
-        self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY', '')
+    @cached_property
+    def shaper_output_dir(self) -> Path:
+        return self.output_dir
 
-        # API Keys - Exa (Signal Generation + Domain Resolution)
-        self.exa_api_key = os.getenv('EXA_API_KEY', '')
+    # API Keys - Apify
+    @cached_property
+    def apify_api_token(self) -> str:
+        return os.getenv('APIFY_API_TOKEN', '')
+
+    # API Keys - AI Providers (for Exa signal synthesis)
+    @cached_property
+    def ai_provider(self) -> str:
+        return os.getenv('AI_PROVIDER', 'openai')
+
+    @cached_property
+    def openai_api_key(self) -> str:
+        return os.getenv('OPENAI_API_KEY', '')
+
+    @cached_property
+    def anthropic_api_key(self) -> str:
+        return os.getenv('ANTHROPIC_API_KEY', '')
+
+    # API Keys - Exa (Signal Generation + Domain Resolution)
+    @cached_property
+    def exa_api_key(self) -> str:
+        return os.getenv('EXA_API_KEY', '')
+
+    # Availability flags are cached too: the underlying keys never change
+    # after load, and status/banner rendering checks these repeatedly
+    @cached_property
+    def _ai_key(self) -> str:
+        if self.ai_provider == 'openai':
+            return self.openai_api_key
+        elif self.ai_provider == 'anthropic':
+            return self.anthropic_api_key
+        return ''
 
-    @property
+    @cached_property
     def has_apify(self) -> bool:
         return bool(self.apify_api_token)
 
-    @property
+    @cached_property
     def has_exa(self) -> bool:
         return bool(self.exa_api_key)
 
-    @property
+    @cached_property
     def has_ai_provider(self) -> bool:
-        if self.ai_provider == 'openai':
-            return bool(self.openai_api_key)
-        elif self.ai_provider == 'anthropic':
-            return bool(self.anthropic_api_key)
-        return False
+        return bool(self._ai_key)
 
     def get_output_dir(self, tool: Optional[str] = None) -> Path:
         return self.output_dir
 
-    def get_config_status(self) -> Dict[str, Any]:
+    @cached_property
+    def _status(self) -> Dict[str, Any]:
         return {
             'framework': {
                 'name': self.framework_name,
@@ -86,6 +123,10 @@ class ShaperConfig:
             }
         }
 
+    def get_config_status(self) -> Dict[str, Any]:
+        # Built once per instance — nothing it reports mutates after load
+        return self._status
+
     def __repr__(self) -> str:
         status = self.get_config_status()
         return f"ShaperConfig({status['shaper']})"
@@ -93,16 +134,22 @@ class ShaperConfig:
 
 # Global config instance
 _config: Optional[ShaperConfig] = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> ShaperConfig:
+    # Double-checked: callers on other threads (progress rendering, loaders)
+    # must never observe a half-constructed singleton
     global _config
     if _config is None:
-        _config = ShaperConfig()
+        with _config_lock:
+            if _config is None:
+                _config = ShaperConfig()
     return _config
 
 
 def reload_config(env_file: Optional[Path] = None) -> ShaperConfig:
-    global _config
+    global _config, _DOTENV_LOADED
+    _DOTENV_LOADED = False  # force a fresh .env parse
     _config = ShaperConfig(env_file)
     return _config
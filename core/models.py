@@ -2,11 +2,16 @@
 Signalis Data Models
 """
 
+import dataclasses
+import sys
 from dataclasses import dataclass
 from typing import Optional
 
+# dataclass(slots=True) needs Python 3.10+; on 3.9 fall back to plain dataclasses
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class FieldMapping:
     """Maps source CSV columns to the 6 standard export fields."""
     signal: Optional[str] = None
@@ -17,7 +22,15 @@ class FieldMapping:
     email: Optional[str] = None
 
     def get_mapped_fields(self) -> dict:
-        return {k: v for k, v in vars(self).items() if v is not None}
+        return {
+            name: value for name in _FIELDS
+            if (value := getattr(self, name)) is not None
+        }
 
     def is_complete(self) -> bool:
         return bool(self.domain or self.company_name)
+
+
+# Field-name tuple computed once — vars()/fields() walks per call are not
+# needed for a schema fixed at import time
+_FIELDS = tuple(f.name for f in dataclasses.fields(FieldMapping))
@@ -3,9 +3,6 @@ Banner and UI components for Signalis
 """
 
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 from core import __version__
 
@@ -19,6 +16,8 @@ TAGLINE = "Signal-driven matching engine for B2B outreach"
 
 def show_banner():
     """Display ASCII art banner"""
+    from rich.panel import Panel
+
     art = (
         "[bold cyan]"
         "███████╗██╗ ██████╗ ███╗   ██╗  █████╗ ██╗     ██╗███████╗\n"
@@ -69,22 +68,34 @@ def show_info(message: str):
 
 def show_preview_table(records: list, headers: list, limit: int = 5):
     """Display preview of data in a table"""
+    from rich.table import Table
+
     table = Table(show_header=True, header_style="bold cyan")
 
-    # Add columns
+    # Add columns (truncate long headers)
     for header in headers:
-        table.add_column(header[:20], overflow="fold")  # Truncate long headers
+        table.add_column(header[:20], overflow="fold")
 
-    # Add rows (limit to preview count)
+    # Add rows (limit to preview count). CSV values are already strings, so
+    # the str() round-trip is skipped for them; the locally-bound record.get
+    # keeps the wide-table inner loop cheap.
     for record in records[:limit]:
-        row = [str(record.get(h, ""))[:30] for h in headers]  # Truncate long values
+        g = record.get
+        row = [
+            v[:30] if isinstance(v := g(h, ""), str) else str(v)[:30]
+            for h in headers
+        ]
         table.add_row(*row)
 
     console.print(table)
 
 
-def create_progress() -> Progress:
+def create_progress():
     """Create a Rich progress bar"""
+    from rich.progress import (
+        Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn,
+    )
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
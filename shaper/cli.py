@@ -435,6 +435,8 @@ def interactive(no_banner: bool):
                                 )
                                 if stats['cache_hits'] > 0:
                                     show_info(f"Cache hits: {stats['cache_hits']}")
+                                if stats['skipped'] > 0:
+                                    show_info(f"Skipped placeholder names: {stats['skipped']}")
                             except Exception as e:
                                 show_warning(f"Domain resolution failed: {type(e).__name__}: {e}")
                                 show_info("Check that your EXA_API_KEY is valid (run: signalis setup)")
@@ -667,14 +669,31 @@ def _process_records(records, mapping, global_signal=None, signal_prefix=None):
         signal_prefix=signal_prefix
     )
 
+    # Hoisted out of the per-row loop: the mapping never changes mid-batch,
+    # and method lookups bound once keep the loop body to the actual work.
+    # (The connector side vectorizes this via pandas; shaper core stays
+    # dependency-light, so the win here is trimming per-row overhead.)
+    full_name_field = mapping.full_name
+    company_field = mapping.company_name
+    domain_field = mapping.domain
+    email_field = mapping.email
+    desc_field = mapping.company_description
+    signal_field = mapping.signal
+    process_signal = signal_processor.process
+    append = processed_records.append
+
+    # Updating the progress bar once per chunk instead of per row keeps
+    # Rich's render work out of the normalization loop
+    _PROGRESS_CHUNK = 256
+
     with create_progress() as progress:
         task = progress.add_task("Normalizing data...", total=len(records))
+        since_update = 0
 
         for record in records:
             processed = {}
 
             # Full name
-            full_name_field = mapping.full_name
             if full_name_field:
                 raw_full_name = record.get(full_name_field, '')
                 if isinstance(raw_full_name, dict):
@@ -694,7 +713,6 @@ def _process_records(records, mapping, global_signal=None, signal_prefix=None):
                 processed['last_name'] = last
 
             # Company
-            company_field = mapping.company_name
             if company_field:
                 raw_company = record.get(company_field, '')
                 # Apify scrapers (e.g. Wellfound) sometimes return company as a
@@ -713,31 +731,32 @@ def _process_records(records, mapping, global_signal=None, signal_prefix=None):
                 processed['company_name'] = processed['company']
 
             # Domain
-            domain_field = mapping.domain
             if domain_field:
-                raw_domain = record.get(domain_field, '')
-                processed['domain'] = normalize_domain(raw_domain)
+                processed['domain'] = normalize_domain(record.get(domain_field, ''))
 
             # Email
-            email_field = mapping.email
             if email_field:
                 processed['email'] = normalize_field(record.get(email_field, ''), 'email')
 
             # Company description (maps to Context)
-            desc_field = mapping.company_description
             if desc_field:
                 processed['company_description'] = normalize_field(record.get(desc_field, ''), 'text')
 
             # Signal (with global signal + prefix support)
-            signal_field = mapping.signal
             row_signal = record.get(signal_field, '') if signal_field else ''
-            processed['signal'] = signal_processor.process(row_signal)
+            processed['signal'] = process_signal(row_signal)
 
             # Preserve raw record for enrichment steps (domain resolution, etc.)
             processed['_raw'] = record
 
-            processed_records.append(processed)
-            progress.update(task, advance=1)
+            append(processed)
+            since_update += 1
+            if since_update >= _PROGRESS_CHUNK:
+                progress.update(task, advance=since_update)
+                since_update = 0
+
+        if since_update:
+            progress.update(task, advance=since_update)
 
     return processed_records
 
@@ -6,9 +6,18 @@ Automatically saves to output/ folder with timestamped filenames.
 """
 
 import csv
-from typing import List, Literal, Optional
+import time
+from functools import lru_cache
+from typing import Iterable, Literal, Optional
 from pathlib import Path
-from datetime import datetime
+
+from core.config import get_config
+
+
+@lru_cache(maxsize=1)
+def _default_output_dir() -> Path:
+    """Resolve (and create) the configured output dir once per process."""
+    return get_config().get_output_dir('shaper')
 
 
 class CSVExporter:
@@ -32,7 +41,7 @@ class CSVExporter:
 
     def export_standard(
         self,
-        records: List[dict],
+        records: Iterable[dict],
         output_path: str,
         include_header: bool = True
     ) -> int:
@@ -42,7 +51,8 @@ class CSVExporter:
         Columns: Full Name, Company Name, Domain, Email, Context, Signal
 
         Args:
-            records: List of record dicts
+            records: Iterable of record dicts (consumed once — a streaming
+                source like CSVLoader.iter_rows() works without a full load)
             output_path: Path to output CSV file
             include_header: Whether to include header row
 
@@ -51,28 +61,28 @@ class CSVExporter:
         """
         Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
+        count = 0
         with open(output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=self.STANDARD_COLUMNS)
+            # Plain csv.writer with row tuples: DictWriter would rebuild the
+            # ordered row from an intermediate dict on every call
+            writer = csv.writer(f)
 
             if include_header:
-                writer.writeheader()
+                writer.writerow(self.STANDARD_COLUMNS)
 
             for record in records:
-                row = self._map_to_standard(record)
-                writer.writerow(row)
-
-        return len(records)
-
-    def _map_to_standard(self, record: dict) -> dict:
-        """Map record to standard format columns."""
-        return {
-            'Full Name': record.get('full_name', ''),
-            'Company Name': record.get('company', '') or record.get('company_name', ''),
-            'Domain': record.get('domain', ''),
-            'Email': record.get('email', ''),
-            'Context': record.get('company_description', '') or record.get('context', ''),
-            'Signal': record.get('signal', '')
-        }
+                g = record.get
+                writer.writerow((
+                    g('full_name', ''),
+                    g('company', '') or g('company_name', ''),
+                    g('domain', ''),
+                    g('email', ''),
+                    g('company_description', '') or g('context', ''),
+                    g('signal', '')
+                ))
+                count += 1
+
+        return count
 
     @staticmethod
     def generate_filename(
@@ -94,17 +104,15 @@ class CSVExporter:
         """
         # Use centralized config if base_dir not provided
         if base_dir is None:
-            from core.config import get_config
-            config = get_config()
-            output_dir = config.get_output_dir('shaper')
+            output_dir = _default_output_dir()
         else:
             output_dir = Path(base_dir)
 
         # Ensure directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate timestamp
-        timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
+        # Generate timestamp (time.strftime skips the datetime allocation)
+        timestamp = time.strftime('%Y-%m-%d_%H%M%S')
 
         # Build filename
         filename = f"{data_type}_{timestamp}.csv"
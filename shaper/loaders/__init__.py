@@ -3,7 +3,15 @@ Data loaders for Signalis
 """
 
 from .base import DataLoader
-from .apify_loader import ApifyLoader
 from .csv_loader import CSVLoader
 
 __all__ = ['DataLoader', 'ApifyLoader', 'CSVLoader']
+
+
+def __getattr__(name):
+    # ApifyLoader is imported on demand (PEP 562): it pulls in requests,
+    # which CSV-only flows never need to pay for
+    if name == 'ApifyLoader':
+        from .apify_loader import ApifyLoader
+        return ApifyLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
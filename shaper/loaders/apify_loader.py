@@ -5,8 +5,10 @@ Fetches data from Apify datasets via API.
 Supports both public datasets (no auth) and private datasets (requires token).
 """
 
+import json
+
 import requests
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 from .base import DataLoader
 
 
@@ -30,47 +32,68 @@ class ApifyLoader(DataLoader):
         self.dataset_id = dataset_id
         self.api_token = api_token
         self.base_url = "https://api.apify.com/v2"
+        self._session: Optional[requests.Session] = None
 
-    def load(self) -> Tuple[List[dict], List[str]]:
+    def _get_session(self) -> requests.Session:
+        """Lazily create one pooled session (reused TCP/TLS connection).
+
+        The auth header is set once on the session instead of per call.
         """
-        Fetch dataset from Apify API.
+        if self._session is None:
+            self._session = requests.Session()
+            if self.api_token:
+                self._session.headers["Authorization"] = f"Bearer {self.api_token}"
+        return self._session
 
-        Returns:
-            Tuple of (records, headers)
+    def iter_records(self) -> Iterator[dict]:
+        """
+        Stream dataset items one at a time.
+
+        Uses Apify's newline-delimited JSON format (format=jsonl) with a
+        streamed response, so only one item is decoded and held in memory
+        at a time regardless of dataset size.
+
+        Yields:
+            One dict per dataset item
 
         Raises:
             requests.HTTPError: If API request fails
-            ValueError: If dataset is empty or invalid
         """
         # Build URL
         url = f"{self.base_url}/datasets/{self.dataset_id}/items"
 
         # Set query parameters
         params = {
-            "format": "json",
+            "format": "jsonl",
             "clean": "true",  # Remove empty fields
         }
 
-        # Add auth header if token provided
-        headers = {}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-
-        # Make request
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+        # Make request (auth header lives on the session)
+        response = self._get_session().get(url, params=params, stream=True, timeout=30)
         response.raise_for_status()
 
-        # Parse response
-        records = response.json()
+        for line in response.iter_lines(decode_unicode=True):
+            if line:
+                yield json.loads(line)
+
+    def load(self) -> Tuple[List[dict], List[str]]:
+        """
+        Fetch dataset from Apify API.
+
+        Returns:
+            Tuple of (records, headers)
+
+        Raises:
+            requests.HTTPError: If API request fails
+            ValueError: If dataset is empty or invalid
+        """
+        records = list(self.iter_records())
 
         if not records:
             raise ValueError(f"Apify dataset {self.dataset_id} is empty")
 
-        if not isinstance(records, list):
-            raise ValueError(f"Invalid Apify response format (expected list, got {type(records).__name__})")
-
         # Extract headers from first record
-        headers_list = list(records[0].keys()) if records else []
+        headers_list = list(records[0].keys())
 
         return records, headers_list
 
@@ -83,11 +106,7 @@ class ApifyLoader(DataLoader):
         """
         url = f"{self.base_url}/datasets/{self.dataset_id}"
 
-        headers = {}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-
-        response = requests.get(url, headers=headers, timeout=30)
+        response = self._get_session().get(url, timeout=30)
         response.raise_for_status()
 
         return response.json()
@@ -7,8 +7,9 @@ Loads CSV files with automatic detection of:
 - Header row
 """
 
+import codecs
 import csv
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
 from pathlib import Path
 from .base import DataLoader
 
@@ -34,27 +35,37 @@ class CSVLoader(DataLoader):
         if not self.file_path.exists():
             raise FileNotFoundError(f"CSV file not found: {file_path}")
 
-    def load(self) -> Tuple[List[dict], List[str]]:
+        # Populated by the first load() so get_info()/get_preview() don't
+        # re-read and re-parse the whole file
+        self._records: Optional[List[dict]] = None
+        self._headers: Optional[List[str]] = None
+        self._delimiter: Optional[str] = None
+        self._encoding: Optional[str] = None
+
+    def iter_rows(self) -> Iterator[dict]:
         """
-        Load CSV file with auto-delimiter detection.
+        Stream CSV rows one at a time with auto-delimiter detection.
 
-        Returns:
-            Tuple of (records, headers)
+        Holds only one row in memory at a time, so downstream row-by-row
+        consumers (mappers, exporters) can pipeline without the O(N) peak
+        RAM of a full load(). Headers/delimiter/encoding are cached on the
+        instance once the file is opened.
+
+        Yields:
+            One dict per CSV row
 
         Raises:
             FileNotFoundError: If file doesn't exist
-            ValueError: If CSV is invalid or empty
+            ValueError: If CSV has no headers
         """
-        # Detect delimiter
-        delimiter = self._detect_delimiter()
+        # If a full load already happened, replay it from memory
+        if self._records is not None:
+            yield from self._records
+            return
 
-        # Detect encoding
+        delimiter = self._detect_delimiter()
         encoding = self._detect_encoding()
 
-        # Load CSV
-        records = []
-        headers = []
-
         with open(self.file_path, 'r', encoding=encoding) as f:
             reader = csv.DictReader(f, delimiter=delimiter)
             headers = reader.fieldnames or []
@@ -62,13 +73,33 @@ class CSVLoader(DataLoader):
             if not headers:
                 raise ValueError(f"CSV file has no headers: {self.file_path}")
 
-            for row in reader:
-                records.append(row)
+            self._headers = headers
+
+            yield from reader
+
+    def load(self) -> Tuple[List[dict], List[str]]:
+        """
+        Load CSV file with auto-delimiter detection.
+
+        Returns:
+            Tuple of (records, headers)
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If CSV is invalid or empty
+        """
+        # Subsequent calls reuse the first parse
+        if self._records is not None:
+            return self._records, self._headers
+
+        records = list(self.iter_rows())
 
         if not records:
             raise ValueError(f"CSV file is empty: {self.file_path}")
 
-        return records, headers
+        self._records = records
+
+        return records, self._headers
 
     def _detect_delimiter(self) -> str:
         """
@@ -77,46 +108,66 @@ class CSVLoader(DataLoader):
         Tries common delimiters: comma, tab, pipe, semicolon
 
         Returns:
-            Detected delimiter character
+            Detected delimiter character (memoized after the first call)
         """
+        if self._delimiter is not None:
+            return self._delimiter
+
         with open(self.file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            # Read first few lines
-            sample = ''.join([f.readline() for _ in range(5)])
+            # One 8KB read instead of line-by-line assembly
+            sample = f.read(8192)
 
         # Use csv.Sniffer
         try:
             sniffer = csv.Sniffer()
             delimiter = sniffer.sniff(sample).delimiter
-            return delimiter
         except Exception:
-            # Fallback: count occurrences of common delimiters
-            delimiters = [',', '\t', '|', ';']
-            counts = {d: sample.count(d) for d in delimiters}
+            # Fallback: count occurrences of common delimiters and take
+            # the one with the highest count (str.count runs in C)
+            counts = (sample.count(','), sample.count('\t'),
+                      sample.count('|'), sample.count(';'))
+            delimiter = (',', '\t', '|', ';')[counts.index(max(counts))]
 
-            # Return delimiter with highest count
-            detected = max(counts.items(), key=lambda x: x[1])[0]
-            return detected
+        self._delimiter = delimiter
+        return delimiter
 
     def _detect_encoding(self) -> str:
         """
         Auto-detect file encoding.
 
         Returns:
-            Encoding name (utf-8, latin1, etc.)
+            Encoding name (utf-8, cp1252, etc.), memoized after the first call
         """
-        # Try common encodings
-        encodings = ['utf-8', 'latin1', 'cp1252', 'iso-8859-1']
-
-        for encoding in encodings:
+        if self._encoding is not None:
+            return self._encoding
+
+        # One binary read, then decode in memory — no re-opening the file
+        # once per candidate encoding
+        with open(self.file_path, 'rb') as f:
+            raw = f.read(4096)
+
+        if raw.startswith(b'\xef\xbb\xbf'):
+            encoding = 'utf-8-sig'  # strips the BOM on read
+        elif raw.startswith((b'\xff\xfe', b'\xfe\xff')):
+            encoding = 'utf-16'
+        else:
             try:
-                with open(self.file_path, 'r', encoding=encoding) as f:
-                    f.read(1024)  # Try reading first 1KB
-                return encoding
-            except (UnicodeDecodeError, LookupError):
-                continue
-
-        # Fallback to utf-8 with error handling
-        return 'utf-8'
+                # Incremental decode (no final=True): a multibyte character
+                # cut off by the 4096-byte window is left pending instead of
+                # raising, so a valid UTF-8 file can't misdetect as cp1252
+                codecs.getincrementaldecoder('utf-8')().decode(raw)
+                encoding = 'utf-8'
+            except UnicodeDecodeError:
+                # Windows exports are the common non-UTF-8 case; latin1
+                # accepts any byte sequence as the last resort
+                try:
+                    raw.decode('cp1252')
+                    encoding = 'cp1252'
+                except UnicodeDecodeError:
+                    encoding = 'latin1'
+
+        self._encoding = encoding
+        return encoding
 
     def get_preview(self, limit: int = 5) -> List[dict]:
         """
@@ -128,8 +179,23 @@ class CSVLoader(DataLoader):
         Returns:
             Limited list of records
         """
-        records, _ = self.load()
-        return records[:limit]
+        # Serve from the full parse if we already have it; otherwise stream
+        # just the first rows instead of materializing the whole file
+        if self._records is not None:
+            return self._records[:limit]
+
+        delimiter = self._detect_delimiter()
+        encoding = self._detect_encoding()
+
+        preview = []
+        with open(self.file_path, 'r', encoding=encoding) as f:
+            reader = csv.DictReader(f, delimiter=delimiter)
+            for row in reader:
+                preview.append(row)
+                if len(preview) >= limit:
+                    break
+
+        return preview
 
     def get_info(self) -> dict:
         """
@@ -140,12 +206,13 @@ class CSVLoader(DataLoader):
         """
         records, headers = self.load()
 
+        # load() cached the detection results — no second pass over the file
         return {
             'file_path': str(self.file_path),
             'file_size': self.file_path.stat().st_size,
             'row_count': len(records),
             'column_count': len(headers),
-            'delimiter': self._detect_delimiter(),
-            'encoding': self._detect_encoding(),
+            'delimiter': self._delimiter,
+            'encoding': self._encoding,
             'headers': headers
         }
@@ -10,100 +10,129 @@ from core.models import FieldMapping
 
 
 # Field detection patterns (ordered by priority)
-# Comprehensive patterns to handle scrapes from multiple sources
+# Comprehensive patterns to handle scrapes from multiple sources.
+# One canonical entry per concept: matching normalizes away case,
+# underscores and spaces, so 'full_name' also covers fullName / Full Name /
+# FULL_NAME etc. without listing each casing.
 FIELD_PATTERNS = {
     'full_name': [
         # Exact matches first
-        'fullName', 'full_name', 'name', 'contactName', 'contact_name',
-        'Full Name', 'Name', 'Contact Name', 'person_name', 'personName',
+        'full_name', 'name', 'contact_name', 'person_name',
         # Common variations
-        'contact', 'Contact', 'person', 'Person', 'individual', 'Individual',
-        'lead_name', 'leadName', 'prospect_name', 'prospectName',
+        'contact', 'person', 'individual', 'lead_name', 'prospect_name',
         # Scraper-specific
         'scraped_name', 'person_full_name', 'full_contact_name',
-        'owner', 'Owner', 'founder', 'Founder', 'ceo', 'CEO'
+        'owner', 'founder', 'ceo'
     ],
     'company_name': [
         # Exact matches first
-        'companyName', 'company_name', 'company', 'organization', 'org',
-        'Company', 'Company Name', 'Organization', 'companyname',
+        'company_name', 'company', 'organization', 'org',
         # Common variations
-        'employer', 'business_name', 'businessName', 'business', 'Business',
-        'firm', 'Firm', 'corporation', 'Corporation', 'entity', 'Entity',
+        'employer', 'business_name', 'business', 'firm', 'corporation', 'entity',
         # Vendor / partner / supply side
-        'vendor', 'Vendor', 'supplier', 'Supplier', 'provider', 'Provider',
-        'partner', 'Partner',
+        'vendor', 'supplier', 'provider', 'partner',
         # Scraper-specific
         'company_legal_name', 'legal_name', 'organization_name',
-        'account', 'Account', 'client', 'Client', 'customer', 'Customer',
-        'brand', 'Brand', 'venture', 'Venture', 'startup', 'Startup'
+        'account', 'client', 'customer', 'brand', 'venture', 'startup'
     ],
     'domain': [
         # Exact matches first
-        'domain', 'website', 'url', 'companyDomain', 'company_domain',
-        'Domain', 'Website', 'URL', 'company_website', 'companyWebsite',
+        'domain', 'website', 'url', 'company_domain', 'company_website',
         # Common variations
-        'web', 'site', 'companyUrl', 'company_url', 'web_url', 'webUrl',
-        'homepage', 'Homepage', 'site_url', 'siteUrl', 'web_address',
+        'web', 'site', 'company_url', 'web_url', 'homepage', 'site_url',
+        'web_address',
         # Scraper-specific
-        'domain_name', 'domainName', 'company_site', 'companySite',
-        'website_url', 'websiteUrl', 'web_domain', 'webDomain',
-        'base_domain', 'baseDomain', 'root_domain', 'rootDomain',
-        'link', 'Link', 'uri', 'URI'
+        'domain_name', 'company_site', 'website_url', 'web_domain',
+        'base_domain', 'root_domain', 'link', 'uri'
     ],
     'email': [
         # Exact matches first
-        'email', 'emailAddress', 'email_address', 'Email', 'Email Address',
-        'e-mail', 'e_mail', 'mail', 'contact_email', 'contactEmail',
+        'email', 'email_address', 'e-mail', 'mail', 'contact_email',
         # Common variations
-        'work_email', 'workEmail', 'business_email', 'businessEmail',
-        'corporate_email', 'corporateEmail', 'professional_email',
+        'work_email', 'business_email', 'corporate_email', 'professional_email',
         # Scraper-specific
-        'email_scraped', 'scraped_email', 'verified_email', 'verifiedEmail',
-        'primary_email', 'primaryEmail', 'contact_mail', 'contactMail',
-        'email_1', 'email1', 'Email1', 'email_primary'
+        'email_scraped', 'scraped_email', 'verified_email', 'primary_email',
+        'contact_mail', 'email_1', 'email_primary'
     ],
     'signal': [
         # Explicit signal fields (HIGH PRIORITY)
-        'signal', 'Signal', 'hiring_signal', 'hiringSignal', 'Hiring Signal',
-        'trigger', 'Trigger', 'why_now', 'whyNow', 'Why Now',
+        'signal', 'hiring_signal', 'trigger', 'why_now',
         # Job posting fields — the ROLE being hired for (not the contact's own title)
-        'job_posting', 'jobPosting', 'posting', 'Posting', 'opening', 'Opening',
-        'vacancy', 'Vacancy', 'hiring_for', 'hiringFor',
-        'open_role', 'openRole', 'open_position', 'openPosition',
+        'job_posting', 'posting', 'opening', 'vacancy', 'hiring_for',
+        'open_role', 'open_position',
         # Hiring intent
-        'hiring_intent', 'hiringIntent',
+        'hiring_intent',
         # NOTE: job_title, title, position, role are handled separately —
         # For DEMAND (job scrapes): these ARE the signal (the role being hired)
         # For SUPPLY: these are the contact's own title and should NOT be signal
-        # See DEMAND_SIGNAL_PATTERNS below
+        # See 'signal_demand_extra' below
     ],
     'company_description': [
         # Exact matches first
-        'context', 'Context', 'companyDescription', 'company_description',
-        'description', 'Description', 'about', 'About', 'Company Description',
+        'context', 'company_description', 'description', 'about',
         # Common variations
-        'company_info', 'companyInfo', 'bio', 'company_bio', 'notes', 'Notes',
-        'overview', 'Overview', 'summary', 'Summary', 'profile', 'Profile',
+        'company_info', 'bio', 'company_bio', 'notes', 'overview', 'summary',
+        'profile',
         # Scraper-specific
-        'company_overview', 'companyOverview', 'about_company', 'aboutCompany',
-        'business_description', 'businessDescription', 'company_summary',
-        'companySummary', 'company_profile', 'companyProfile',
-        'details', 'Details', 'info', 'Info', 'information', 'Information',
-        'background', 'Background', 'company_background', 'companyBackground'
+        'company_overview', 'about_company', 'business_description',
+        'company_summary', 'company_profile', 'details', 'info', 'information',
+        'background', 'company_background'
     ],
     # Additional signal patterns for DEMAND data only
     # For demand (job scrapes): job_title IS the signal — it's the role being hired
     # For supply: job_title is the contact's own title (e.g., "CEO") — NOT signal
     'signal_demand_extra': [
-        'job_title', 'jobTitle', 'Job Title', 'title', 'Title',
-        'position', 'Position', 'role', 'Role',
-        'job', 'Job', 'current_position', 'currentPosition',
-        'job_role', 'jobRole', 'Job Role',
+        'job_title', 'title', 'position', 'role', 'job',
+        'current_position', 'job_role',
     ],
 }
 
 
+def _norm(name: str) -> str:
+    """Canonical form for pattern/column comparison: casing, underscores
+    and spaces are presentation differences, not different concepts."""
+    return name.lower().replace('_', '').replace(' ', '')
+
+
+# Fields never auto-detected — always handled explicitly in Step 5
+SKIP_AUTO = {'signal', 'company_description'}
+
+
+def _build_index(patterns: Dict[str, List[str]]) -> tuple:
+    """Invert a pattern table into (exact, normalized) lookup dicts.
+
+    Maps pattern -> (target_field, priority rank) so auto_map makes a
+    single pass over the record's keys instead of testing every pattern
+    against the column set. The normalized index covers the
+    case/snake/camel/space variants that used to be listed explicitly.
+    """
+    index: Dict[str, tuple] = {}
+    index_norm: Dict[str, tuple] = {}
+    for target_field, field_patterns in patterns.items():
+        if target_field in SKIP_AUTO:
+            continue
+        for rank, pattern in enumerate(field_patterns):
+            index.setdefault(pattern, (target_field, rank))
+            index_norm.setdefault(_norm(pattern), (target_field, rank))
+    return index, index_norm
+
+
+# The two final pattern tables (and their inverted indexes) are fixed at
+# import time; instances just reference them unless custom_patterns forces
+# a private copy. Interactive runs rebuild the mapper per pass, so this
+# keeps construction to a couple of attribute assignments.
+_PATTERNS_SUPPLY = {
+    field: patterns for field, patterns in FIELD_PATTERNS.items()
+    if field != 'signal_demand_extra'
+}
+_PATTERNS_DEMAND = {
+    **_PATTERNS_SUPPLY,
+    'signal': _PATTERNS_SUPPLY['signal'] + FIELD_PATTERNS['signal_demand_extra'],
+}
+_INDEX_SUPPLY = _build_index(_PATTERNS_SUPPLY)
+_INDEX_DEMAND = _build_index(_PATTERNS_DEMAND)
+
+
 class AutoMapper:
     """
     Automatically detect field mappings from source data.
@@ -123,28 +152,30 @@ class AutoMapper:
             custom_patterns: Optional custom field patterns to merge with defaults
         """
         self.data_type = data_type
-        self.patterns = {}
 
-        # Copy base patterns (excluding the demand-only extras)
-        for field, patterns in FIELD_PATTERNS.items():
-            if field != 'signal_demand_extra':
-                self.patterns[field] = list(patterns)
-
-        # For demand data: append job_title/title/position to signal patterns
-        # These are the roles being hired for — they ARE the demand signal
-        if data_type == 'demand' and 'signal_demand_extra' in FIELD_PATTERNS:
-            self.patterns['signal'] = self.patterns['signal'] + FIELD_PATTERNS['signal_demand_extra']
+        # Demand appends job_title/title/position to the signal patterns —
+        # those are the roles being hired for, i.e. the demand signal
+        if data_type == 'demand':
+            self.patterns = _PATTERNS_DEMAND
+            index = _INDEX_DEMAND
+        else:
+            self.patterns = _PATTERNS_SUPPLY
+            index = _INDEX_SUPPLY
 
         if custom_patterns:
+            # Custom patterns force a private copy of the shared table
+            self.patterns = {field: list(patterns) for field, patterns in self.patterns.items()}
             for field, patterns in custom_patterns.items():
                 if field in self.patterns:
                     # Prepend custom patterns (higher priority)
                     self.patterns[field] = patterns + self.patterns[field]
                 else:
                     self.patterns[field] = patterns
+            index = _build_index(self.patterns)
+
+        self._pattern_index, self._pattern_index_norm = index
 
-    # Fields never auto-detected — always handled explicitly in Step 5
-    SKIP_AUTO = {'signal', 'company_description'}
+    SKIP_AUTO = SKIP_AUTO
 
     def auto_map(self, sample_record: dict) -> FieldMapping:
         """
@@ -157,24 +188,32 @@ class AutoMapper:
             FieldMapping with detected mappings (signal/context never auto-set)
         """
         mapping = FieldMapping()
-        available_fields = set(sample_record.keys())
-        # Case-insensitive lookup: lowercase → actual column name
-        lower_to_actual = {k.lower(): k for k in available_fields}
-
-        # Try to map each target field — skip signal and context (handled in Step 5)
-        for target_field, patterns in self.patterns.items():
-            if target_field in self.SKIP_AUTO:
-                continue
-            for pattern in patterns:
-                if pattern in available_fields:
-                    # Exact match (preferred)
-                    setattr(mapping, target_field, pattern)
-                    break
-                actual = lower_to_actual.get(pattern.lower())
-                if actual:
-                    # Case-insensitive match (e.g. DOMAIN, EMAIL, COMPANY)
-                    setattr(mapping, target_field, actual)
-                    break
+
+        # One pass over the record's columns, keeping the best hit per target
+        # field. Priority order matches the old nested loop: lower pattern
+        # rank wins, and at equal rank an exact match beats a normalized
+        # (case/underscore/space-folded) one. Signal/context are excluded
+        # from the index (handled in Step 5).
+        best: Dict[str, tuple] = {}  # target_field -> (rank, norm_flag, column)
+        exact_get = self._pattern_index.get
+        norm_get = self._pattern_index_norm.get
+        best_get = best.get
+        for column in sample_record:
+            hit = exact_get(column)
+            if hit is not None:
+                target_field, rank = hit
+                prev = best_get(target_field)
+                if prev is None or (rank, 0) < prev[:2]:
+                    best[target_field] = (rank, 0, column)
+            hit = norm_get(_norm(column))
+            if hit is not None:
+                target_field, rank = hit
+                prev = best_get(target_field)
+                if prev is None or (rank, 1) < prev[:2]:
+                    best[target_field] = (rank, 1, column)
+
+        for target_field, (_, _, column) in best.items():
+            setattr(mapping, target_field, column)
 
         return mapping
 
@@ -194,19 +233,16 @@ class AutoMapper:
         Returns:
             Confidence score 0.0 to 1.0
         """
+        # Required fields (80% of score) — need at least domain + company_name;
+        # optional fields (20%). Direct attribute reads, no getattr loop.
         score = 0.0
+        if mapping.domain is not None:
+            score += 0.4
+        if mapping.company_name is not None:
+            score += 0.4
 
-        # Required fields (80% of score) — need at least domain + company_name
-        required = ['domain', 'company_name']
-        for field in required:
-            if getattr(mapping, field) is not None:
-                score += 0.8 / len(required)
-
-        # Optional fields (20% of score)
-        optional = ['full_name', 'email']
-        mapped_optional = sum(1 for field in optional if getattr(mapping, field) is not None)
-        if optional:
-            score += (mapped_optional / len(optional)) * 0.2
+        mapped_optional = (mapping.full_name is not None) + (mapping.email is not None)
+        score += mapped_optional * 0.1
 
         return min(score, 1.0)
 
@@ -232,10 +268,4 @@ class AutoMapper:
         Returns:
             Dict of {target_field: source_field} for mapped fields
         """
-        summary = {}
-        for field in vars(mapping):
-            source = getattr(mapping, field)
-            if source is not None:
-                summary[field] = source
-
-        return summary
+        return mapping.get_mapped_fields()
@@ -4,10 +4,11 @@ Interactive field mapper
 Provides an interactive UI for manually mapping source fields to target fields.
 """
 
+import sys
+
 from typing import List, Optional, Dict, Any
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
-from rich.panel import Panel
 from core.models import FieldMapping
 from ..banner import console
 
@@ -24,6 +25,29 @@ FRIENDLY = {
 STEP5_FIELDS = {'signal', 'company_description'}
 
 
+def _print_block(*lines: str) -> None:
+    """Emit several markup lines with one console.print call.
+
+    Each print re-parses markup and flushes stdout, so the mapper's little
+    two/three-line groups are joined and rendered in a single pass.
+    """
+    console.print("\n".join(lines))
+
+
+def _emit(*renderables) -> None:
+    """Render tables (and trailing lines) into a buffer, write once.
+
+    Rich renders segment-by-segment straight to the terminal; capturing the
+    whole block first turns a large source-columns table into a single
+    stdout write instead of one per row.
+    """
+    with console.capture() as capture:
+        for renderable in renderables:
+            console.print(renderable)
+    sys.stdout.write(capture.get())
+    sys.stdout.flush()
+
+
 class InteractiveMapper:
     """
     Interactive field mapping with Rich UI.
@@ -44,6 +68,39 @@ class InteractiveMapper:
         self.source_headers = source_headers
         self.sample_records = sample_records or []
 
+        # Precomputed once: the prompt loop re-runs matching on every retry,
+        # and wide CSVs shouldn't pay a per-attempt lower() on each header
+        self._header_set = frozenset(source_headers)
+        self._lower_headers = [h.lower() for h in source_headers]
+        # Formatted sample strings per header, computed once — the source
+        # columns table re-renders whenever mapping restarts
+        self._previews = self._build_previews() if self.sample_records else {}
+
+        # Last rendered summary, replayed verbatim when the mapping is
+        # unchanged (user backtracked without remapping anything)
+        self._summary_key: Optional[tuple] = None
+        self._summary_render = ""
+
+    def _build_previews(self) -> Dict[str, str]:
+        """Format the per-header sample strings for the columns table."""
+        samples_by_header: Dict[str, List[str]] = {h: [] for h in self.source_headers}
+
+        for record in self.sample_records[:3]:
+            for header, samples in samples_by_header.items():
+                val = record.get(header, "")
+                if val:
+                    if isinstance(val, dict):
+                        val = val.get('name') or val.get('title') or val.get('url') or str(val)
+                    val_str = str(val)[:40]
+                    if len(str(val)) > 40:
+                        val_str += "..."
+                    samples.append(val_str)
+
+        return {
+            header: " | ".join(samples) if samples else "[dim]<empty>[/dim]"
+            for header, samples in samples_by_header.items()
+        }
+
     def map(self, auto_mapping: Optional[FieldMapping] = None) -> FieldMapping:
         """
         Interactively map fields.
@@ -56,17 +113,18 @@ class InteractiveMapper:
         """
         console.print()
         console.rule("[bold cyan]Field Mapping[/bold cyan]", style="cyan")
-        console.print("[dim]Match your source columns to the standard export format.[/dim]")
-        console.print("[dim]Type a column [bold]#[/bold] or [bold]name[/bold] at each prompt · Enter = accept auto / skip[/dim]")
+        _print_block(
+            "[dim]Match your source columns to the standard export format.[/dim]",
+            "[dim]Type a column [bold]#[/bold] or [bold]name[/bold] at each prompt · Enter = accept auto / skip[/dim]",
+            ""
+        )
 
         # Show available source columns once, near the top
-        console.print()
         self._show_source_columns()
 
         # If auto-mapping provided and complete, offer to accept it outright
         if auto_mapping and auto_mapping.is_complete():
-            console.print()
-            console.print("[green]☉ All required fields auto-detected[/green]")
+            _print_block("", "[green]☉ All required fields auto-detected[/green]")
             self._show_auto_mapping(auto_mapping)
 
             if Confirm.ask("\n[cyan]Use auto-detected mapping?[/cyan]", default=True):
@@ -133,19 +191,7 @@ class InteractiveMapper:
             table.add_column("Sample Values", style="white", overflow="fold")
 
             for i, header in enumerate(self.source_headers, 1):
-                samples = []
-                for record in self.sample_records[:3]:
-                    val = record.get(header, "")
-                    if val:
-                        if isinstance(val, dict):
-                            val = val.get('name') or val.get('title') or val.get('url') or str(val)
-                        val_str = str(val)[:40]
-                        if len(str(val)) > 40:
-                            val_str += "..."
-                        samples.append(val_str)
-
-                sample_text = " | ".join(samples) if samples else "[dim]<empty>[/dim]"
-                table.add_row(f"{i}.", header, sample_text)
+                table.add_row(f"{i}.", header, self._previews[header])
         else:
             table = Table(title="Source Columns", show_header=False)
             table.add_column("Index", style="dim", width=6)
@@ -153,7 +199,7 @@ class InteractiveMapper:
             for i, header in enumerate(self.source_headers, 1):
                 table.add_row(f"{i}.", header)
 
-        console.print(table)
+        _emit(table)
 
     def _show_auto_mapping(self, mapping: FieldMapping):
         """Display auto-detected mapping (mapper fields only, friendly names)."""
@@ -166,11 +212,18 @@ class InteractiveMapper:
             if source is not None:
                 table.add_row(label, source)
 
-        console.print(table)
-        console.print("[dim]Signal & Context → configured in next step[/dim]")
+        _emit(table, "[dim]Signal & Context → configured in next step[/dim]")
 
     def _show_mapping_summary(self, mapping: FieldMapping):
         """Display final mapping summary (4 fields, logical order)."""
+        # Skip the table build + markup walk entirely when nothing changed
+        # since the last render — just replay the captured output
+        key = tuple(getattr(mapping, field, None) for field in FRIENDLY)
+        if key == self._summary_key:
+            sys.stdout.write(self._summary_render)
+            sys.stdout.flush()
+            return
+
         table = Table(
             title="[bold cyan]Mapping Summary[/bold cyan]",
             show_header=True,
@@ -202,18 +255,23 @@ class InteractiveMapper:
             display = f"◆ {label}" if is_req else f"  {label}"
             table.add_row(display, source or "[dim]-[/dim]", status)
 
-        console.print(table)
-        console.print()
-
         if mapped_required == 2:
-            console.print("[bold green]☉ Both identifiers mapped[/bold green]")
+            status = "[bold green]☉ Both identifiers mapped[/bold green]"
         elif mapped_required == 1:
-            console.print("[yellow]▲ One identifier mapped — Exa can fill the other[/yellow]")
+            status = "[yellow]▲ One identifier mapped — Exa can fill the other[/yellow]"
         else:
-            console.print("[red]☿ No identifier mapped — need domain or company name to proceed[/red]")
+            status = "[red]☿ No identifier mapped — need domain or company name to proceed[/red]"
 
         total_mapped = sum(1 for f in FRIENDLY if getattr(mapping, f, None))
-        console.print(f"[dim]{total_mapped} of 4 fields mapped · Signal & Context → Step 5[/dim]")
+        with console.capture() as capture:
+            console.print(table)
+            console.print("\n" + status)
+            console.print(f"[dim]{total_mapped} of 4 fields mapped · Signal & Context → Step 5[/dim]")
+
+        self._summary_key = key
+        self._summary_render = capture.get()
+        sys.stdout.write(self._summary_render)
+        sys.stdout.flush()
 
     def _inline_preview(self, column_name: str) -> str:
         """
@@ -268,10 +326,12 @@ class InteractiveMapper:
         """
         # Compact header: "Domain (1/2)  company website · e.g. acme.com"
         step_tag = f" [dim]({step})[/dim]" if step else ""
-        console.print(f"[bold cyan]{field_name}[/bold cyan]{step_tag}  [dim]{hint}[/dim]")
+        header = f"[bold cyan]{field_name}[/bold cyan]{step_tag}  [dim]{hint}[/dim]"
 
         if default:
-            console.print(f"  [green]☉ auto:[/green] [white]{default}[/white]")
+            _print_block(header, f"  [green]☉ auto:[/green] [white]{default}[/white]")
+        else:
+            console.print(header)
 
         while True:
             user_input = Prompt.ask(
@@ -286,9 +346,8 @@ class InteractiveMapper:
                 return None
 
             # Use the default value directly (user pressed Enter with a default)
-            if user_input == default and default in self.source_headers:
-                preview = self._inline_preview(default)
-                console.print(f"  [green]☉ {default}[/green]  [dim]{preview}[/dim]" if preview else f"  [green]☉ {default}[/green]")
+            if user_input == default and default in self._header_set:
+                self._confirm_selection(default)
                 return default
 
             # Numeric index
@@ -296,29 +355,40 @@ class InteractiveMapper:
                 index = int(user_input) - 1
                 if 0 <= index < len(self.source_headers):
                     selected = self.source_headers[index]
-                    preview = self._inline_preview(selected)
-                    console.print(f"  [green]☉ {selected}[/green]  [dim]{preview}[/dim]" if preview else f"  [green]☉ {selected}[/green]")
+                    self._confirm_selection(selected)
                     return selected
                 else:
                     console.print(f"  [red]☿ Invalid — must be 1–{len(self.source_headers)}[/red]")
                     continue
 
-            # Exact name match
-            if user_input in self.source_headers:
-                preview = self._inline_preview(user_input)
-                console.print(f"  [green]☉ {user_input}[/green]  [dim]{preview}[/dim]" if preview else f"  [green]☉ {user_input}[/green]")
+            # Exact name match (set lookup, not a list scan)
+            if user_input in self._header_set:
+                self._confirm_selection(user_input)
                 return user_input
 
-            # Fuzzy / substring match
-            matches = [h for h in self.source_headers if user_input.lower() in h.lower()]
+            # Fuzzy / substring match against the pre-lowered headers
+            needle = user_input.lower()
+            matches = [
+                h for lower, h in zip(self._lower_headers, self.source_headers)
+                if needle in lower
+            ]
             if len(matches) == 1:
-                preview = self._inline_preview(matches[0])
-                console.print(f"  [green]☉ {matches[0]}[/green]  [dim]{preview}[/dim]" if preview else f"  [green]☉ {matches[0]}[/green]")
+                self._confirm_selection(matches[0])
                 return matches[0]
             elif matches:
                 console.print(f"  [yellow]Did you mean:[/yellow] {', '.join(matches[:5])}")
             else:
                 short = ', '.join(self.source_headers[:5])
                 more = f' (+{len(self.source_headers)-5} more)' if len(self.source_headers) > 5 else ''
-                console.print(f"  [red]☿ Not found:[/red] '{user_input}'")
-                console.print(f"  [dim]Columns: {short}{more}[/dim]")
+                _print_block(
+                    f"  [red]☿ Not found:[/red] '{user_input}'",
+                    f"  [dim]Columns: {short}{more}[/dim]"
+                )
+
+    def _confirm_selection(self, selected: str) -> None:
+        """Print the single confirmation line for a chosen column."""
+        preview = self._inline_preview(selected)
+        if preview:
+            console.print(f"  [green]☉ {selected}[/green]  [dim]{preview}[/dim]")
+        else:
+            console.print(f"  [green]☉ {selected}[/green]")
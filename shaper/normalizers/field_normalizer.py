@@ -8,8 +8,25 @@ Handles common data cleaning:
 - Lowercase for specific fields
 """
 
+import re
+import sys
+from functools import lru_cache
 from typing import Any
 
+# Compiled once: one sub() pass beats the split()-list + join() reallocation
+_WS_RE = re.compile(r'\s+')
+
+# A string is "dirty" if it has edge whitespace, a doubled space, or any
+# whitespace that isn't a plain space — exactly the cases strip()/collapse
+# would change. No match means the value can pass through untouched.
+_DIRTY_RE = re.compile(r'^\s|\s$|\s\s|[^\S ]')
+
+
+@lru_cache(maxsize=16384)
+def _title_name(text: str) -> str:
+    """Title-case a name, memoized — datasets repeat names heavily."""
+    return text.title()
+
 
 def normalize_field(value: Any, field_type: str = 'text') -> str:
     """
@@ -26,6 +43,11 @@ def normalize_field(value: Any, field_type: str = 'text') -> str:
     if value is None or value == '':
         return ''
 
+    # Fast path: already-clean text strings (the bulk of tidy exports)
+    # skip the stringify/strip/collapse pipeline entirely
+    if field_type == 'text' and type(value) is str and _DIRTY_RE.search(value) is None:
+        return sys.intern(value) if len(value) < 64 else value
+
     # Convert to string
     text = str(value).strip()
 
@@ -33,7 +55,7 @@ def normalize_field(value: Any, field_type: str = 'text') -> str:
         return ''
 
     # Collapse multiple spaces
-    text = ' '.join(text.split())
+    text = _WS_RE.sub(' ', text)
 
     # Apply type-specific normalization
     if field_type == 'email':
@@ -48,6 +70,8 @@ def normalize_field(value: Any, field_type: str = 'text') -> str:
         # Title case for names (e.g., "john doe" -> "John Doe")
         # But preserve existing capitalization if reasonable
         if text.islower() or text.isupper():
-            text = text.title()
+            text = _title_name(text)
 
-    return text
+    # Batches repeat companies, emails and names heavily; interning short
+    # results collapses the duplicates to one object each
+    return sys.intern(text) if len(text) < 64 else text
@@ -4,8 +4,12 @@ Name splitting utility
 Splits full names into first/last names with basic heuristics.
 """
 
+import re
 from typing import Tuple
 
+# Any interior whitespace means the name actually needs splitting
+_WS_RE = re.compile(r'\s')
+
 
 def split_name(full_name: str) -> Tuple[str, str]:
     """
@@ -35,15 +39,15 @@ def split_name(full_name: str) -> Tuple[str, str]:
     if not full_name or not isinstance(full_name, str):
         return ('', '')
 
-    # Clean and split
-    parts = full_name.strip().split()
-
-    if not parts:
+    name = full_name.strip()
+    if not name:
         return ('', '')
 
-    if len(parts) == 1:
-        # Single name (e.g., "Madonna")
-        return (parts[0], '')
+    # Single name (e.g., "Madonna") — skip the split() list allocation
+    if _WS_RE.search(name) is None:
+        return (name, '')
+
+    parts = name.split()
 
     # Multiple parts: first word + last word
     first_name = parts[0]
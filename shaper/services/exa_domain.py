@@ -5,16 +5,91 @@ Uses Exa's company search to find company domains from company names.
 Lightweight — no AI needed, just Exa search + URL extraction.
 """
 
+import asyncio
+import concurrent.futures
+import importlib.util
+import json
 import os
+import time
+from pathlib import Path
 from typing import Optional, Dict, List
 from ..banner import console
 from ..normalizers import normalize_domain
 
-try:
-    from exa_py import Exa
-    HAS_EXA = True
-except ImportError:
-    HAS_EXA = False
+# Availability check without executing the package: the SDK import itself
+# is deferred to the constructor so CLI startup never pays for it
+HAS_EXA = importlib.util.find_spec('exa_py') is not None
+
+
+# Resolved domains persist across runs — Exa latency dominates everything
+# else in this module, so re-paying it for companies seen last run is the
+# worst possible cache miss. 30-day TTL tolerates the occasional stale domain.
+CACHE_FILE = Path.home() / '.signalis' / 'exa_domain_cache.json'
+CACHE_TTL_DAYS = 30
+_TTL_SECONDS = CACHE_TTL_DAYS * 86400
+
+# Placeholder "company names" common in scraped datasets — each would burn
+# an Exa round-trip that can never resolve to a real domain
+_UNRESOLVABLE_NAMES = frozenset({
+    'n/a', 'na', 'none', 'null', 'private', 'anonymous', 'unknown',
+    'confidential', 'undisclosed', '-', '--',
+})
+
+
+def _looks_resolvable(name: str) -> bool:
+    """Cheap pre-dispatch check: could this name plausibly resolve?"""
+    name = name.strip()
+    if len(name) < 3:
+        return False
+    if name.lower() in _UNRESOLVABLE_NAMES:
+        return False
+    # All-punctuation placeholders like "???" or "---"
+    if not any(c.isalnum() for c in name):
+        return False
+    return True
+
+
+# Raw-record fields probed for disambiguation context, in priority order
+_LOC_FIELDS = ('jobLocation', 'job_location', 'location', 'Location', 'city', 'City')
+_CLS_FIELDS = ('classification', 'Classification', 'industry', 'Industry',
+               'subClassification', 'category', 'Category')
+
+
+def _cache_key(company: str, context: str) -> str:
+    """Cache/dedupe key for one (company, context) lookup.
+
+    The single source of truth for the key format: resolve_domain's cache
+    and both batch dedupe passes must agree on it, or duplicate rows stop
+    collapsing and silently repeat paid Exa lookups.
+    """
+    return f"{company.lower().strip()}|{context.lower().strip()[:50]}"
+
+
+def _build_context(record: Dict[str, str]) -> str:
+    """Assemble the disambiguation context string for one record."""
+    raw = record.get('_raw', {})
+    context_parts = []
+
+    # Location disambiguates (e.g., "Mercury San Francisco" vs "Mercury Detroit")
+    for loc_field in _LOC_FIELDS:
+        loc = raw.get(loc_field, '')
+        if loc:
+            context_parts.append(str(loc))
+            break
+
+    # Industry/classification narrows the search
+    for cls_field in _CLS_FIELDS:
+        cls_val = raw.get(cls_field, '')
+        if cls_val:
+            context_parts.append(str(cls_val))
+            break
+
+    # Company description if available
+    desc = record.get('company_description', '') or raw.get('advertiserDescription', '')
+    if desc:
+        context_parts.append(str(desc)[:100])
+
+    return ' '.join(context_parts)
 
 
 class ExaDomainResolver:
@@ -29,15 +104,68 @@ class ExaDomainResolver:
         if not HAS_EXA:
             raise ImportError("exa_py package required. Install with: pip install exa-py")
 
+        from exa_py import Exa
         self.exa = Exa(api_key=exa_api_key)
 
         # Stats
         self.resolved = 0
         self.failed = 0
         self.cache_hits = 0
+        self.skipped = 0
 
-        # Cache by company name
+        # Cache by company name, seeded from the fresh entries on disk
         self.cache: Dict[str, str] = {}
+        self._cache_times: Dict[str, float] = {}
+        self._load_disk_cache()
+
+    def _load_disk_cache(self) -> None:
+        """Load fresh entries from the persistent cache file, if any."""
+        if not CACHE_FILE.exists():
+            return
+        try:
+            with open(CACHE_FILE, 'r') as f:
+                data = json.load(f)
+        except Exception:
+            return  # unreadable cache is just a cold start
+
+        cutoff = time.time() - _TTL_SECONDS
+        for key, entry in data.items():
+            try:
+                resolved_at = float(entry['resolved_at'])
+                if resolved_at > cutoff:
+                    self.cache[key] = entry['domain']
+                    self._cache_times[key] = resolved_at
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    def save_cache(self) -> None:
+        """Persist resolved domains (atomic: temp file + rename)."""
+        try:
+            CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            data = {
+                key: {'domain': domain, 'resolved_at': self._cache_times.get(key, 0.0)}
+                for key, domain in self.cache.items()
+            }
+            tmp = CACHE_FILE.with_suffix('.tmp')
+            with open(tmp, 'w') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(tmp, CACHE_FILE)
+        except Exception:
+            pass  # persistence is best-effort; the in-memory cache still works
+
+    # Shared across instances and batches: the work is pure network wait,
+    # so threads are cheap and rebuilding a pool per batch just re-pays
+    # thread startup. EXA_MAX_WORKERS tunes concurrency without a release.
+    _executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    @classmethod
+    def _get_executor(cls) -> concurrent.futures.ThreadPoolExecutor:
+        if cls._executor is None:
+            cls._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(os.getenv('EXA_MAX_WORKERS', '20')),
+                thread_name_prefix='exa-domain',
+            )
+        return cls._executor
 
     @classmethod
     def from_env(cls) -> 'ExaDomainResolver':
@@ -62,7 +190,7 @@ class ExaDomainResolver:
             return None
 
         # Cache check (include context in key for different disambiguation)
-        cache_key = f"{company_name.lower().strip()}|{context.lower().strip()[:50]}"
+        cache_key = _cache_key(company_name, context)
         if cache_key in self.cache:
             self.cache_hits += 1
             return self.cache[cache_key]
@@ -86,6 +214,7 @@ class ExaDomainResolver:
                     domain = normalize_domain(url)
                     if domain:
                         self.cache[cache_key] = domain
+                        self._cache_times[cache_key] = time.time()
                         self.resolved += 1
                         return domain
 
@@ -96,6 +225,26 @@ class ExaDomainResolver:
             self.failed += 1
             return None
 
+    def _needs_domain(self, records: List[Dict[str, str]]) -> List[tuple]:
+        """Select (index, record) pairs worth dispatching to Exa.
+
+        Besides the empty-domain check, placeholder company names ("N/A",
+        "Private", "-") are rejected up front — each would otherwise cost
+        a full network round-trip that cannot succeed.
+        """
+        needs_domain = []
+        for i, record in enumerate(records):
+            if record.get('domain'):
+                continue
+            company = record.get('company_name') or record.get('company')
+            if not company:
+                continue
+            if not _looks_resolvable(company):
+                self.skipped += 1
+                continue
+            needs_domain.append((i, record))
+        return needs_domain
+
     def resolve_batch(
         self,
         records: List[Dict[str, str]],
@@ -105,6 +254,8 @@ class ExaDomainResolver:
         Resolve missing domains for a batch of records.
 
         Only processes records where domain is empty but company_name exists.
+        Records are mutated in place — each resolved domain is written once
+        per row, with no per-future record rebuilding or reassignment.
 
         Args:
             records: List of processed record dicts
@@ -113,52 +264,41 @@ class ExaDomainResolver:
         Returns:
             Records with domains filled where possible
         """
-        import concurrent.futures
         from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
         # Find records that need domain resolution
-        needs_domain = [
-            (i, r) for i, r in enumerate(records)
-            if not r.get('domain') and (r.get('company_name') or r.get('company'))
-        ]
+        needs_domain = self._needs_domain(records)
 
         if not needs_domain:
             console.print("[dim]No records need domain resolution[/dim]")
             return records
 
-        def resolve_record(idx_record):
-            idx, record = idx_record
+        # Dedupe at dispatch: job scrapes repeat the same employer across
+        # many rows, so group indices by resolve_domain's cache key and
+        # submit one lookup per unique (company, context) pair.
+        groups: Dict[str, List[int]] = {}
+        lookups = []  # (cache_key, company, context) — one per unique key
+        for idx, record in needs_domain:
             company = record.get('company_name') or record.get('company') or ''
-
-            # Build context from raw data for better accuracy
-            raw = record.get('_raw', {})
-            context_parts = []
-
-            # Location disambiguates (e.g., "Mercury San Francisco" vs "Mercury Detroit")
-            for loc_field in ['jobLocation', 'job_location', 'location', 'Location', 'city', 'City']:
-                loc = raw.get(loc_field, '')
-                if loc:
-                    context_parts.append(str(loc))
-                    break
-
-            # Industry/classification narrows the search
-            for cls_field in ['classification', 'Classification', 'industry', 'Industry',
-                              'subClassification', 'category', 'Category']:
-                cls_val = raw.get(cls_field, '')
-                if cls_val:
-                    context_parts.append(str(cls_val))
-                    break
-
-            # Company description if available
-            desc = record.get('company_description', '') or raw.get('advertiserDescription', '')
-            if desc:
-                context_parts.append(str(desc)[:100])
-
-            context = ' '.join(context_parts)
-            domain = self.resolve_domain(company, context=context)
+            context = _build_context(record)
+            cache_key = _cache_key(company, context)
+            bucket = groups.setdefault(cache_key, [])
+            if not bucket:
+                lookups.append((cache_key, company, context))
+            bucket.append(idx)
+
+        def resolve_one(lookup):
+            cache_key, company, context = lookup
+            return cache_key, self.resolve_domain(company, context=context)
+
+        def fan_out(cache_key, domain):
             if domain:
-                record['domain'] = domain
-            return idx, record
+                for idx in groups[cache_key]:
+                    records[idx]['domain'] = domain
+
+        # executor.map keeps one future per in-flight item and yields in
+        # submission order, which is all the progress loop needs
+        executor = self._get_executor()
 
         if show_progress:
             with Progress(
@@ -169,29 +309,73 @@ class ExaDomainResolver:
                 console=console
             ) as progress:
                 task = progress.add_task(
-                    "[cyan]Resolving domains with Exa...", total=len(needs_domain)
+                    "[cyan]Resolving domains with Exa...", total=len(lookups)
                 )
 
-                with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                    futures = {
-                        executor.submit(resolve_record, item): item
-                        for item in needs_domain
-                    }
-
-                    for future in concurrent.futures.as_completed(futures):
-                        idx, record = future.result()
-                        records[idx] = record
-                        progress.update(task, advance=1)
+                for cache_key, domain in executor.map(resolve_one, lookups):
+                    fan_out(cache_key, domain)
+                    progress.update(task, advance=1)
         else:
-            with concurrent.futures.ThreadPoolExecutor(max_workers=5) as executor:
-                futures = {
-                    executor.submit(resolve_record, item): item
-                    for item in needs_domain
-                }
+            for cache_key, domain in executor.map(resolve_one, lookups):
+                fan_out(cache_key, domain)
+
+        # Persist what this batch learned for future runs
+        self.save_cache()
+
+        return records
+
+    async def resolve_batch_async(
+        self,
+        records: List[Dict[str, str]],
+        max_concurrency: int = 20,
+    ) -> List[Dict[str, str]]:
+        """
+        Async variant of resolve_batch for callers already inside an event loop.
+
+        The Exa SDK is synchronous, so each lookup runs on the shared thread
+        pool via run_in_executor; the semaphore caps in-flight requests so a
+        huge batch doesn't queue the whole pool at once.
+
+        Args:
+            records: List of processed record dicts
+            max_concurrency: Maximum simultaneous Exa lookups
+
+        Returns:
+            Records with domains filled where possible
+        """
+        needs_domain = self._needs_domain(records)
+
+        if not needs_domain:
+            return records
+
+        # Same dispatch-level dedupe as the sync path
+        groups: Dict[str, List[int]] = {}
+        lookups = []
+        for idx, record in needs_domain:
+            company = record.get('company_name') or record.get('company') or ''
+            context = _build_context(record)
+            cache_key = _cache_key(company, context)
+            bucket = groups.setdefault(cache_key, [])
+            if not bucket:
+                lookups.append((cache_key, company, context))
+            bucket.append(idx)
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def resolve_one(cache_key, company, context):
+            async with semaphore:
+                domain = await loop.run_in_executor(
+                    executor, self.resolve_domain, company, context
+                )
+            if domain:
+                for idx in groups[cache_key]:
+                    records[idx]['domain'] = domain
+
+        await asyncio.gather(*[resolve_one(*lookup) for lookup in lookups])
 
-                for future in concurrent.futures.as_completed(futures):
-                    idx, record = future.result()
-                    records[idx] = record
+        self.save_cache()
 
         return records
 
@@ -201,4 +385,5 @@ class ExaDomainResolver:
             'resolved': self.resolved,
             'failed': self.failed,
             'cache_hits': self.cache_hits,
+            'skipped': self.skipped,
         }
@@ -8,44 +8,142 @@ Demand signals: Hiring activity, funding, expansion — the timing trigger
 Supply signals: What they do + why they need intros/deal flow
 """
 
+import asyncio
+import concurrent.futures
+import importlib.util
+import json
 import os
+import random
+import re
+import sqlite3
+import threading
+import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from pathlib import Path
+from typing import Optional, Dict, Iterable, Iterator, List
 from ..banner import console
 
-# Optional imports
-try:
-    from exa_py import Exa
-    HAS_EXA = True
-except ImportError:
-    HAS_EXA = False
+# Optional dependencies: availability is probed without executing the
+# packages (the SDK imports are deferred to the constructor), so loading
+# this module never pays their import cost
+HAS_EXA = importlib.util.find_spec('exa_py') is not None
+HAS_OPENAI = importlib.util.find_spec('openai') is not None
+HAS_ANTHROPIC = importlib.util.find_spec('anthropic') is not None
+
+# Signal cache bounds: signals (funding, hiring) legitimately stale within
+# days, and an unbounded dict grows for the life of a long-running job.
+# Oldest-insertion eviction keeps RSS flat past the cap.
+CACHE_MAX_ENTRIES = 10_000
+CACHE_TTL_SECONDS = 24 * 3600
+
+# Persistent layer: reruns over the same dataset are common (tweak mapping,
+# re-export) and each one re-paid the full Exa+AI cost without it. Demand
+# signals expire faster than supply/context — freshness is their whole point.
+DB_FILE = Path.home() / '.signalis' / 'signal_cache.db'
+DEMAND_DISK_TTL = 7 * 86400
+SUPPLY_DISK_TTL = 30 * 86400
+
+# Raw research cache: short-lived, memory only. Lets a rerun over the same
+# companies (retuned prompts, signal-only vs context-only passes) reuse the
+# Exa results without treating them as durable facts.
+RESEARCH_CACHE_MAX = 5000
+RESEARCH_TTL_SECONDS = 6 * 3600
+
+
+def _disk_ttl(key: str) -> int:
+    """TTL for a cache key ('demand:...', 'supply:...', 'enrich:<type>:...')."""
+    parts = key.split(':', 2)
+    kind = parts[1] if parts[0] == 'enrich' else parts[0]
+    return DEMAND_DISK_TTL if kind == 'demand' else SUPPLY_DISK_TTL
+
+
+class _SignalDiskCache:
+    """Tiny SQLite key/value store shared across CLI runs.
+
+    WAL + NORMAL synchronous keeps per-write overhead low; the single
+    connection is shared across worker threads behind a lock.
+    """
+
+    def __init__(self, path: Path):
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS signals ('
+            'cache_key TEXT PRIMARY KEY, value TEXT, created_at INTEGER)'
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: str, ttl: int) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value, created_at FROM signals WHERE cache_key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at = row
+            if time.time() - created_at > ttl:
+                self._conn.execute('DELETE FROM signals WHERE cache_key = ?', (key,))
+                return None
+            return value
+
+    def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO signals VALUES (?, ?, ?)',
+                (key, value, int(time.time())),
+            )
+
 
-try:
-    import openai
-    HAS_OPENAI = True
-except ImportError:
-    HAS_OPENAI = False
+class _RateLimiter:
+    """Token-bucket limiter shared by every AI-calling thread.
 
-try:
-    from anthropic import Anthropic
-    HAS_ANTHROPIC = True
-except ImportError:
-    HAS_ANTHROPIC = False
+    The worker-count cap is a blunt rate control: ten threads in lockstep
+    can still burst well past a provider's RPM tier and trip 429s, while a
+    generous tier is left underused. A bucket refilled at AI_MAX_RPS lets
+    the pool run at the provider's actual limit instead of ours.
+    """
+
+    def __init__(self, rps: float):
+        self._rate = max(0.1, rps)
+        self._capacity = max(1.0, self._rate)
+        self._tokens = self._capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._last) * self._rate
+                )
+                self._last = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self._rate
+            time.sleep(wait)
 
 
 # =============================================================================
 # PROMPTS
 # =============================================================================
+# Each prompt is split into a static instruction block (the system prompt —
+# identical across every call, so providers can serve it from a cached
+# prefix) and a small dynamic template holding the per-company fields.
+#
+# The instruction blocks are module-level constants passed by reference, so
+# per-record assembly only ever allocates the few hundred bytes of dynamic
+# text — the multi-KB taxonomy is never copied, concatenated, or re-parsed
+# in the hot loop, no interning needed.
 
-DEMAND_SIGNAL_PROMPT = """Extract a WHY NOW timing trigger for a cold intro email.
+DEMAND_SIGNAL_SYSTEM = """Extract a WHY NOW timing trigger for a cold intro email.
 
-Company: {company_name}
-Domain: {domain}
-{context_line}
-Recent activity found online:
-{research}
-
-YOUR JOB: Find the single strongest timing trigger from the research above.
+YOUR JOB: Find the single strongest timing trigger from the research provided.
 
 PRIORITY ORDER (use the first one you find):
 1. Hiring specific roles → "Hiring: VP of Sales" or "Posted 3 Clinical Research Associates"
@@ -77,16 +175,21 @@ Always include the specific role title with its function keyword.
 "Hiring: 3 Sales Engineers" is better than "Hiring: 3 new team members"
 "Hiring: Senior Clinical Research Associate" is better than "Growing science team"
 "Hiring: Investment Analyst" is better than "Expanding the team"
+"""
 
-Signal:"""
-
-CONTEXT_PROMPT = """Write a 1-2 sentence description of what this company does.
-
-Company: {company_name}
+def _render_demand_prompt(company_name: str, domain: str, context_line: str, research: str) -> str:
+    """Dynamic user block for the demand prompt (f-string: no per-call
+    template re-parse the way str.format pays in the hot loop)."""
+    return f"""Company: {company_name}
 Domain: {domain}
-Info found online:
+{context_line}
+Recent activity found online:
 {research}
 
+Signal:"""
+
+CONTEXT_SYSTEM = """Write a 1-2 sentence description of what this company does.
+
 YOUR JOB: Describe what this company does in plain, factual language.
 
 RULES:
@@ -94,15 +197,18 @@ RULES:
 - Mention their core service/product and who they serve
 - No marketing fluff or superlatives
 - If you cannot determine what they do, return exactly: NONE
+"""
+
+def _render_context_prompt(company_name: str, domain: str, research: str) -> str:
+    """Dynamic user block for the context prompt."""
+    return f"""Company: {company_name}
+Domain: {domain}
+Info found online:
+{research}
 
 Description:"""
 
-SUPPLY_SIGNAL_PROMPT = """Write a one-line signal for a service provider explaining what they do and why they need intros.
-
-Company: {company_name}
-Domain: {domain}
-{context_line}
-{research_line}
+SUPPLY_SIGNAL_SYSTEM = """Write a one-line signal for a service provider explaining what they do and why they need intros.
 
 YOUR JOB: Describe what this company does + why connecting them to companies makes sense.
 
@@ -146,10 +252,148 @@ RULES:
 - Be specific about what they do (recruit, staff, build, consult, invest, advise, etc.)
 - Under 30 words
 - If you can't determine what they do, return exactly: NONE
+"""
+
+def _render_supply_prompt(company_name: str, domain: str, context_line: str, research_line: str) -> str:
+    """Dynamic user block for the supply prompt."""
+    return f"""Company: {company_name}
+Domain: {domain}
+{context_line}
+{research_line}
 
 Signal:"""
 
 
+# Fused demand prompt: signal + description from one completion. The demand
+# research already contains everything both answers need, so asking for
+# them together halves the AI calls (and round-trips) per demand record.
+FUSED_DEMAND_SYSTEM = DEMAND_SIGNAL_SYSTEM + """
+SECOND TASK — COMPANY DESCRIPTION:
+Also write a 1-2 sentence description of what the company does, in plain
+factual language: their core service/product and who they serve, no marketing
+fluff or superlatives. If you cannot determine what they do, use exactly NONE.
+
+OUTPUT FORMAT:
+Return a JSON object with exactly two string fields:
+{"signal": "<the signal line, or NONE>", "context": "<the description, or NONE>"}
+"""
+
+def _render_fused_prompt(company_name: str, domain: str, context_line: str, research: str) -> str:
+    """Dynamic user block for the fused demand prompt."""
+    return f"""Company: {company_name}
+Domain: {domain}
+{context_line}
+Recent activity found online:
+{research}
+
+JSON:"""
+
+
+# Cheap demand-signal extraction, tried before AI synthesis: Exa highlights
+# frequently contain the exact funding/hiring phrasing the prompt asks the
+# model to echo back, and a compiled regex gets it in microseconds.
+_FUNDING_RE = re.compile(
+    r'raised\s+(?:a\s+|an\s+)?\$\s?(\d+(?:\.\d+)?)\s*(million|billion|[MBK])\b'
+    r'(?:[^.\n|]{0,40}?(Series\s+[A-F]))?',
+    re.IGNORECASE,
+)
+_HIRING_RE = re.compile(
+    r"(?:now\s+hiring|we'?re\s+hiring|hiring)[:\s]+([A-Z][^.\n|]{4,60})"
+)
+
+# Signal post-processing, compiled once: edge whitespace/quotes (plus any
+# trailing period) go in a single substitution, and the in-band nulls the
+# model may emit are matched in one pass instead of an upper() + tuple scan
+_SIGNAL_TRIM_RE = re.compile(r'^[\s"\']+|[\s"\'.]+$')
+_SIGNAL_NONE_RE = re.compile(r'(?:NONE|N/?A|EMPTY)', re.IGNORECASE)
+
+
+def _regex_extract_demand(research: str) -> Optional[str]:
+    """Extract an obvious funding or hiring signal straight from research.
+
+    Returns a prompt-format signal line, or None when nothing unambiguous
+    is present and the AI should synthesize as usual.
+    """
+    m = _FUNDING_RE.search(research)
+    if m:
+        amount, unit, series = m.groups()
+        unit = {'million': 'M', 'billion': 'B'}.get(unit.lower(), unit.upper())
+        signal = f"Raised: ${amount}{unit}"
+        if series:
+            signal += f" {series.title()}"
+        return signal
+
+    m = _HIRING_RE.search(research)
+    if m:
+        role = m.group(1).strip().rstrip(',;:-– ')
+        if 5 <= len(role) <= 60:
+            return f"Hiring: {role}"
+
+    return None
+
+
+# Records that can never enrich, caught before any Exa or AI spend: personal
+# email providers aren't companies, and placeholder names always come back
+# NONE. Same spirit as _UNRESOLVABLE_NAMES in exa_domain.
+_FREEMAIL = frozenset({
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+    'aol.com', 'icloud.com', 'proton.me',
+})
+_GARBAGE_NAMES = frozenset({'n/a', 'na', 'none', 'unknown', 'test', 'tbd', '.', '-'})
+
+
+# Stable per-template routing keys for OpenAI's automatic prompt cache:
+# a consistent key steers every call for the same template to the same
+# cache shard, so the shared system prefix actually gets reused
+_PROMPT_CACHE_KEYS = {
+    DEMAND_SIGNAL_SYSTEM: 'shaper-demand',
+    SUPPLY_SIGNAL_SYSTEM: 'shaper-supply',
+    CONTEXT_SYSTEM: 'shaper-context',
+    FUSED_DEMAND_SYSTEM: 'shaper-demand-fused',
+}
+
+def _widen_connection_pool(exa) -> None:
+    """Enlarge the keep-alive pool of exa-py's underlying requests session.
+
+    requests defaults to 10 pooled sockets per host while our executor runs
+    up to EXA_MAX_WORKERS threads against api.exa.ai — past ten in flight,
+    each extra worker opens (and re-handshakes TLS on) a throwaway
+    connection. Best-effort: exa-py versions that don't expose a requests
+    session are left untouched.
+    """
+    try:
+        import requests
+        from requests.adapters import HTTPAdapter
+    except ImportError:
+        return
+    for attr in ('client', 'session', '_client'):
+        session = getattr(exa, attr, None)
+        if isinstance(session, requests.Session):
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=64))
+            return
+
+
+# Strict schema for the fused demand call (OpenAI structured outputs):
+# both keys are always present, as strings, so parsing never branches on
+# missing fields. "NONE" stays the in-band null, matching the prompt.
+_FUSED_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'enrichment',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'signal': {'type': 'string'},
+                'context': {'type': 'string'},
+            },
+            'required': ['signal', 'context'],
+            'additionalProperties': False,
+        },
+    },
+}
+
+
 class ExaSignalGenerator:
     """
     Generate signals by researching companies with Exa and synthesizing with AI.
@@ -171,7 +415,9 @@ class ExaSignalGenerator:
         if not HAS_EXA:
             raise ImportError("exa_py package required. Install with: pip install exa-py")
 
+        from exa_py import Exa
         self.exa = Exa(api_key=exa_api_key)
+        _widen_connection_pool(self.exa)
         self.ai_provider = ai_provider
         self.ai_api_key = ai_api_key
         self.ai_model = ai_model
@@ -179,8 +425,10 @@ class ExaSignalGenerator:
         # Initialize AI client once (connection reuse across all calls)
         self._ai_client = None
         if ai_provider == 'openai' and HAS_OPENAI and ai_api_key:
+            import openai
             self._ai_client = openai.OpenAI(api_key=ai_api_key)
         elif ai_provider == 'anthropic' and HAS_ANTHROPIC and ai_api_key:
+            from anthropic import Anthropic
             self._ai_client = Anthropic(api_key=ai_api_key)
 
         # Stats
@@ -190,12 +438,101 @@ class ExaSignalGenerator:
         self.signals_generated = 0
         self.skipped_no_data = 0
         self.failed = 0
+        self.cache_read_tokens = 0
+        self.regex_signals = 0
 
         # Error tracking — distinct errors collected during enrichment
         self._errors: List[str] = []
 
-        # Cache by domain
-        self.cache: Dict[str, str] = {}
+        # Paces AI calls to the provider's rate tier instead of leaning on
+        # the worker count; AI_MAX_RPS tunes it per key without a release
+        self._ai_limiter = _RateLimiter(float(os.getenv('AI_MAX_RPS', '10')))
+
+        # Bounded TTL cache by domain: key -> (value, cached_at). Guarded by
+        # a lock — enrich_batch has 10 workers reading and writing it.
+        self.cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.RLock()
+
+        # Raw Exa research by (kind, company): key -> (text, cached_at)
+        self._research_cache: Dict[str, tuple] = {}
+        self._research_lock = threading.Lock()
+
+        # In-flight enrichments by cache key: duplicate rows dispatched
+        # before the first result lands wait on the leader's future rather
+        # than repeating its Exa+AI work
+        self._inflight: Dict[str, concurrent.futures.Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Best-effort persistent layer under the in-memory cache — a broken
+        # or read-only disk just means every run starts cold
+        self._disk_cache: Optional[_SignalDiskCache] = None
+        try:
+            DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+            self._disk_cache = _SignalDiskCache(DB_FILE)
+        except Exception:
+            pass
+
+        # Shared pool for paired Exa queries and paired AI calls. Built
+        # lazily: single-call records never need it, and a throwaway pool
+        # per record would spawn and join threads O(records) times.
+        self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+    def _cache_get(self, key: str):
+        """Return the cached value for key, or None if absent/expired.
+
+        Falls through to the persistent store on a memory miss, promoting
+        disk hits into the in-memory cache.
+        """
+        with self._cache_lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                value, cached_at = entry
+                if time.time() - cached_at <= CACHE_TTL_SECONDS:
+                    return value
+                del self.cache[key]
+
+        if self._disk_cache is not None:
+            try:
+                raw = self._disk_cache.get(key, _disk_ttl(key))
+            except Exception:
+                raw = None
+            if raw is not None:
+                value = json.loads(raw)
+                if isinstance(value, list):
+                    value = tuple(value)
+                self._cache_set(key, value, write_through=False)
+                return value
+
+        return None
+
+    def _cache_set(self, key: str, value, write_through: bool = True) -> None:
+        """Store value under key, evicting the oldest entry past the cap."""
+        with self._cache_lock:
+            if key in self.cache:
+                del self.cache[key]  # re-insert to refresh eviction order
+            elif len(self.cache) >= CACHE_MAX_ENTRIES:
+                del self.cache[next(iter(self.cache))]
+            self.cache[key] = (value, time.time())
+
+        if write_through and self._disk_cache is not None:
+            try:
+                self._disk_cache.set(key, json.dumps(value))
+            except Exception:
+                pass  # persistence is best-effort
+
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=20,
+                thread_name_prefix='exa-ai',
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """Release the shared executor (safe to call repeatedly)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
 
     @classmethod
     def from_env(cls) -> 'ExaSignalGenerator':
@@ -208,10 +545,10 @@ class ExaSignalGenerator:
 
         if ai_provider == 'openai':
             ai_key = os.getenv('OPENAI_API_KEY', '')
-            ai_model = os.getenv('OPENAI_MODEL', 'gpt-4o-mini')
+            ai_model = os.getenv('OPENAI_MODEL', 'gpt-4.1-nano')
         elif ai_provider == 'anthropic':
             ai_key = os.getenv('ANTHROPIC_API_KEY', '')
-            ai_model = os.getenv('ANTHROPIC_MODEL', 'claude-3-haiku-20240307')
+            ai_model = os.getenv('ANTHROPIC_MODEL', 'claude-3-5-haiku-latest')
         else:
             ai_key = ''
             ai_model = None
@@ -227,50 +564,89 @@ class ExaSignalGenerator:
     # EXA SEARCH
     # =========================================================================
 
+    def _research_get(self, key: str) -> Optional[str]:
+        """Return cached research text for key, or None if absent/expired."""
+        with self._research_lock:
+            entry = self._research_cache.get(key)
+            if entry is None:
+                return None
+            text, cached_at = entry
+            if time.time() - cached_at > RESEARCH_TTL_SECONDS:
+                del self._research_cache[key]
+                return None
+            return text
+
+    def _research_set(self, key: str, text: str) -> None:
+        """Cache research text, evicting the oldest entry past the cap."""
+        with self._research_lock:
+            if key in self._research_cache:
+                del self._research_cache[key]
+            elif len(self._research_cache) >= RESEARCH_CACHE_MAX:
+                del self._research_cache[next(iter(self._research_cache))]
+            self._research_cache[key] = (text, time.time())
+
+    def _exa_call(self, kwargs: dict) -> str:
+        """Run one Exa search and format the results; failures yield ''.
+
+        Exa's search API takes one query per HTTPS request — there is no
+        multi-query endpoint in the SDK — so "batching" here means
+        dispatching these concurrently on the shared pool and deduplicating
+        repeated companies before they reach the network.
+        """
+        try:
+            r = self.exa.search_and_contents(**kwargs)
+        except Exception:
+            return ''
+        self.search_count += 1
+        return self._format_results(r)
+
     def _search_demand(self, domain: str, company_name: str) -> str:
         """
         Search for demand signals: hiring, funding, expansion.
 
-        Two targeted queries with highlights:
+        Two targeted queries with highlights, dispatched concurrently —
+        they're independent network round-trips, so the pair costs
+        max(q1, q2) instead of q1 + q2:
           1. Hiring — job boards, highlights focused on role titles + departments
           2. Funding/news — news category, highlights focused on amounts + rounds
         Falls back to a general query if both return nothing.
         """
         search_name = company_name or domain
+
+        research_key = f"demand:{search_name.lower().strip()}"
+        cached = self._research_get(research_key)
+        if cached is not None:
+            return cached
+
         start_date = (datetime.now() - timedelta(days=180)).strftime('%Y-%m-%d')
-        parts = []
 
-        # Query 1 — Hiring signals (job boards, keyword search, fresh content)
-        try:
-            r = self.exa.search_and_contents(
-                f'"{search_name}" hiring OR "open role" OR "job opening" OR "we\'re hiring" OR "now hiring"',
+        queries = [
+            # Query 1 — Hiring signals (job boards, keyword search, fresh content)
+            dict(
+                query=f'"{search_name}" hiring OR "open role" OR "job opening" OR "we\'re hiring" OR "now hiring"',
                 num_results=4,
                 start_published_date=start_date,
                 include_domains=["builtin.com", "greenhouse.io", "lever.co", "jobs.ashbyhq.com", "wellfound.com"],
                 highlights={"query": "job title role department function team size headcount", "maxCharacters": 300},
+                text=False,
                 type="keyword",
                 livecrawl="preferred",
-            )
-            self.search_count += 1
-            parts.append(self._format_results(r))
-        except Exception:
-            pass
-
-        # Query 2 — Funding / news (news category, neural search)
-        try:
-            r = self.exa.search_and_contents(
-                f'"{search_name}" raised OR funding OR "series A" OR "series B" OR expansion OR acquisition OR partnership',
+            ),
+            # Query 2 — Funding / news (news category, neural search)
+            dict(
+                query=f'"{search_name}" raised OR funding OR "series A" OR "series B" OR expansion OR acquisition OR partnership',
                 num_results=4,
                 start_published_date=start_date,
                 include_domains=["techcrunch.com", "crunchbase.com", "businesswire.com", "prnewswire.com", "reuters.com", "bloomberg.com"],
                 highlights={"query": "funding amount raised series round investment expansion", "maxCharacters": 300},
+                text=False,
                 category="news",
                 type="auto",
-            )
-            self.search_count += 1
-            parts.append(self._format_results(r))
-        except Exception:
-            pass
+            ),
+        ]
+
+        executor = self._get_executor()
+        parts = [f.result() for f in [executor.submit(self._exa_call, q) for q in queries]]
 
         combined = '\n'.join(p for p in parts if p)
 
@@ -282,6 +658,7 @@ class ExaSignalGenerator:
                     num_results=5,
                     start_published_date=start_date,
                     highlights={"query": "hiring role funding raised expansion", "maxCharacters": 300},
+                    text=False,
                     type="auto",
                 )
                 self.search_count += 1
@@ -292,52 +669,55 @@ class ExaSignalGenerator:
                 if err not in self._errors:
                     self._errors.append(err)
 
+        if combined:
+            self._research_set(research_key, combined)
+
         return combined
 
     def _search_supply(self, domain: str, company_name: str) -> str:
         """
         Search for supply info: what the company does, who they serve.
 
-        Two targeted queries with highlights:
+        Two targeted queries with highlights, dispatched concurrently like
+        the demand pair:
           1. Company domain — company category, highlights on services + expertise
           2. Client evidence — neural search for case studies, trusted-by mentions
         Falls back to a general query if neither returns anything.
         """
         search_name = company_name or domain
-        parts = []
+
+        # Domain is part of the key: it changes which queries run below
+        research_key = f"supply:{(domain or '').lower().strip()}:{search_name.lower().strip()}"
+        cached = self._research_get(research_key)
+        if cached is not None:
+            return cached
+
+        queries = []
 
         # Primary: company's own domain (company category for best coverage)
         if domain:
-            try:
-                results = self.exa.search_and_contents(
-                    f"{company_name or domain} services expertise",
-                    num_results=3,
-                    include_domains=[domain],
-                    highlights={"query": "services clients industries expertise capabilities vertical niche", "maxCharacters": 350},
-                    category="company",
-                    type="auto",
-                )
-                self.search_count += 1
-                text = self._format_results(results)
-                if text:
-                    parts.append(text)
-            except Exception:
-                pass
+            queries.append(dict(
+                query=f"{company_name or domain} services expertise",
+                num_results=3,
+                include_domains=[domain],
+                highlights={"query": "services clients industries expertise capabilities vertical niche", "maxCharacters": 350},
+                text=False,
+                category="company",
+                type="auto",
+            ))
 
         # Secondary: client/vertical evidence (neural — finds semantically similar content)
-        try:
-            results = self.exa.search_and_contents(
-                f'"{search_name}" client OR "case study" OR "we help" OR "trusted by" OR "works with"',
-                num_results=3,
-                highlights={"query": "client industry vertical customer sector we help", "maxCharacters": 300},
-                type="neural",
-            )
-            self.search_count += 1
-            text = self._format_results(results)
-            if text:
-                parts.append(text)
-        except Exception:
-            pass
+        queries.append(dict(
+            query=f'"{search_name}" client OR "case study" OR "we help" OR "trusted by" OR "works with"',
+            num_results=3,
+            highlights={"query": "client industry vertical customer sector we help", "maxCharacters": 300},
+            text=False,
+            type="neural",
+        ))
+
+        executor = self._get_executor()
+        futures = [executor.submit(self._exa_call, q) for q in queries]
+        parts = [text for text in (f.result() for f in futures) if text]
 
         # Fallback: general search if neither returned results
         if not parts:
@@ -346,6 +726,7 @@ class ExaSignalGenerator:
                     f'"{search_name}" specializes OR "we help" OR "our clients" OR "our work"',
                     num_results=3,
                     highlights={"query": "specializes services clients expertise vertical", "maxCharacters": 300},
+                    text=False,
                     type="neural",
                 )
                 self.search_count += 1
@@ -356,23 +737,27 @@ class ExaSignalGenerator:
                 if err not in self._errors:
                     self._errors.append(err)
 
-        return '\n'.join(p for p in parts if p)
+        combined = '\n'.join(p for p in parts if p)
+        if combined:
+            self._research_set(research_key, combined)
+
+        return combined
 
     def _format_results(self, results) -> str:
         """Format Exa results into text for AI prompt.
 
-        Prefers highlights (targeted excerpts) over full text — more relevant
-        and token-efficient. Falls back to truncated text if highlights absent.
+        Uses highlights only (targeted excerpts). Every search passes
+        text=False, so full-page bodies — often 50-200KB each, of which we
+        previously kept 300 chars — never cross the wire at all.
         """
         texts = []
         for r in results.results:
             title = getattr(r, 'title', '') or ''
             highlights = getattr(r, 'highlights', None) or []
-            text = getattr(r, 'text', '') or ''
             published = getattr(r, 'published_date', '') or ''
 
             date_tag = f" [{published[:10]}]" if published else ''
-            content = ' | '.join(h for h in highlights if h) if highlights else text[:300]
+            content = ' | '.join(h for h in highlights if h)
 
             if title or content:
                 line = f"- {title}{date_tag}"
@@ -386,60 +771,138 @@ class ExaSignalGenerator:
     # AI SYNTHESIS
     # =========================================================================
 
-    def _call_ai(self, prompt: str, max_tokens: int = 120) -> str:
-        """Call AI provider to synthesize signal/context from research."""
+    def _call_ai(self, system: str, prompt: str, max_tokens: int = 120,
+                 json_mode: bool = False) -> str:
+        """Call AI provider to synthesize signal/context from research.
+
+        The static instruction block travels separately from the small
+        per-company prompt so providers can reuse a cached prefix across
+        the whole batch instead of reprocessing the taxonomy every call.
+        json_mode constrains OpenAI to valid JSON output; Anthropic follows
+        the JSON instructions in the system block without a dedicated flag.
+
+        Calls are paced by the shared token bucket, and rate-limit errors
+        retry (twice) with Retry-After / jittered exponential backoff.
+        """
         if not self._ai_client:
             return ''
+        for attempt in range(3):
+            self._ai_limiter.acquire()
+            try:
+                if self.ai_provider == 'openai':
+                    # System message keeps the cacheable prefix byte-identical
+                    # across calls; prompt_cache_key pins each template to its
+                    # own cache entry so the three prompts don't evict each other
+                    kwargs = {}
+                    if json_mode:
+                        # Strict schema instead of bare json_object: guarantees
+                        # both keys exist, so _parse_fused never has to guess
+                        kwargs['response_format'] = _FUSED_RESPONSE_FORMAT
+                    response = self._ai_client.chat.completions.create(
+                        model=self.ai_model or 'gpt-4.1-nano',
+                        messages=[
+                            {'role': 'system', 'content': system},
+                            {'role': 'user', 'content': prompt},
+                        ],
+                        temperature=0.3,
+                        max_tokens=max_tokens,
+                        extra_body={'prompt_cache_key': _PROMPT_CACHE_KEYS.get(system, 'shaper')},
+                        **kwargs,
+                    )
+                    self.ai_call_count += 1
+                    return (response.choices[0].message.content or '').strip()
+
+                elif self.ai_provider == 'anthropic':
+                    # cache_control marks the static block for ephemeral prompt
+                    # caching: every record after the first reads the instruction
+                    # prefix from cache instead of paying full input tokens
+                    response = self._ai_client.messages.create(
+                        model=self.ai_model or 'claude-3-5-haiku-latest',
+                        max_tokens=max_tokens,
+                        temperature=0.3,
+                        system=[{
+                            'type': 'text',
+                            'text': system,
+                            'cache_control': {'type': 'ephemeral'},
+                        }],
+                        messages=[{'role': 'user', 'content': prompt}],
+                    )
+                    self.ai_call_count += 1
+                    usage = getattr(response, 'usage', None)
+                    if usage is not None:
+                        self.cache_read_tokens += getattr(usage, 'cache_read_input_tokens', 0) or 0
+                    return response.content[0].text.strip() if response.content else ''
+
+                return ''
+
+            except Exception as e:
+                # 429s are transient by definition: honor Retry-After when
+                # the provider sends one, otherwise exponential backoff with
+                # jitter so stalled workers don't retry in lockstep
+                if type(e).__name__ == 'RateLimitError' and attempt < 2:
+                    headers = getattr(getattr(e, 'response', None), 'headers', None)
+                    try:
+                        retry_after = float(headers.get('retry-after', 0)) if headers else 0.0
+                    except (TypeError, ValueError):
+                        retry_after = 0.0
+                    time.sleep(max(retry_after, 2 ** attempt + random.random()))
+                    continue
+                err = f"AI call error ({self.ai_provider}): {type(e).__name__}: {e}"
+                if err not in self._errors:
+                    self._errors.append(err)
+                return ''
+
+        return ''
+
+    def _parse_fused(self, raw: str) -> tuple:
+        """Parse a fused JSON response into (signal, description).
+
+        Either element is None when missing, NONE, or outside sanity bounds.
+        """
+        if not raw:
+            return None, None
+
+        text = raw.strip()
+        # Tolerate fenced output from models that ignore json_mode
+        if text.startswith('```'):
+            text = text.strip('`').strip()
+            if text.startswith('json'):
+                text = text[4:]
+
         try:
-            if self.ai_provider == 'openai':
-                response = self._ai_client.chat.completions.create(
-                    model=self.ai_model or 'gpt-4o-mini',
-                    messages=[{'role': 'user', 'content': prompt}],
-                    temperature=0.3,
-                    max_tokens=max_tokens,
-                )
-                self.ai_call_count += 1
-                return (response.choices[0].message.content or '').strip()
-
-            elif self.ai_provider == 'anthropic':
-                response = self._ai_client.messages.create(
-                    model=self.ai_model or 'claude-3-haiku-20240307',
-                    max_tokens=max_tokens,
-                    temperature=0.3,
-                    messages=[{'role': 'user', 'content': prompt}],
-                )
-                self.ai_call_count += 1
-                return response.content[0].text.strip() if response.content else ''
+            data = json.loads(text)
+        except ValueError:
+            return None, None
+        if not isinstance(data, dict):
+            return None, None
 
-            return ''
+        signal = self._clean_signal(str(data.get('signal') or ''))
 
-        except Exception as e:
-            err = f"AI call error ({self.ai_provider}): {type(e).__name__}: {e}"
-            if err not in self._errors:
-                self._errors.append(err)
-            return ''
+        desc = str(data.get('context') or '').strip().strip('"\'')
+        if desc.upper() in ('NONE', 'N/A', '') or not (10 <= len(desc) <= 500):
+            desc = None
+
+        return signal, desc
 
     def _clean_signal(self, raw: str) -> Optional[str]:
         """Clean AI output into usable signal. Returns None if unusable."""
         if not raw:
             return None
 
-        signal = raw.strip().strip('"\'').strip()
+        # One substitution covers the strip/quote-strip/trailing-period
+        # dance the old version did in five string passes
+        signal = _SIGNAL_TRIM_RE.sub('', raw)
 
         # AI returned "NONE" — means no clear signal found
-        if signal.upper() in ('NONE', 'N/A', 'EMPTY', '""', "''"):
+        if _SIGNAL_NONE_RE.fullmatch(signal):
             return None
 
         # Remove "Signal:" prefix if AI echoed it
-        if signal.lower().startswith('signal:'):
+        if signal[:7].lower() == 'signal:':
             signal = signal[7:].strip()
 
-        # Remove trailing period
-        if signal.endswith('.'):
-            signal = signal[:-1]
-
         # Sanity check: too short or too long
-        if len(signal) < 5 or len(signal) > 200:
+        if not 5 <= len(signal) <= 200:
             return None
 
         return signal
@@ -467,9 +930,10 @@ class ExaSignalGenerator:
 
         # Cache check
         cache_key = f"{data_type}:{(domain or company_name).lower().strip()}"
-        if cache_key in self.cache:
+        cached = self._cache_get(cache_key)
+        if cached is not None:
             self.cache_hits += 1
-            return self.cache[cache_key]
+            return cached
 
         # Context line for AI prompt (pass what we know about the company)
         context_line = f"What they do: {company_description[:300]}" if company_description else ""
@@ -480,11 +944,17 @@ class ExaSignalGenerator:
             if not research:
                 return None
 
-            prompt = DEMAND_SIGNAL_PROMPT.format(
-                company_name=company_name or domain,
-                domain=domain or '',
-                context_line=context_line,
-                research=research,
+            # Heuristic first — an unambiguous hit skips the AI call
+            quick = _regex_extract_demand(research)
+            if quick:
+                self.regex_signals += 1
+                self._cache_set(cache_key, quick)
+                self.signals_generated += 1
+                return quick
+
+            system = DEMAND_SIGNAL_SYSTEM
+            prompt = _render_demand_prompt(
+                company_name or domain, domain or '', context_line, research
             )
 
         else:
@@ -499,24 +969,248 @@ class ExaSignalGenerator:
                     return None
                 research_line = f"Info found online:\n{research}"
 
-            prompt = SUPPLY_SIGNAL_PROMPT.format(
-                company_name=company_name or domain,
-                domain=domain or '',
-                context_line=context_line,
-                research_line=research_line,
+            system = SUPPLY_SIGNAL_SYSTEM
+            prompt = _render_supply_prompt(
+                company_name or domain, domain or '', context_line, research_line
             )
 
         # AI synthesis
-        raw = self._call_ai(prompt)
+        raw = self._call_ai(system, prompt)
         signal = self._clean_signal(raw)
 
         if signal:
-            self.cache[cache_key] = signal
+            self._cache_set(cache_key, signal)
             self.signals_generated += 1
             return signal
 
         return None
 
+    def _apply_cached_pair(self, record, pair, need_signal, need_context):
+        """Copy a cached (signal, description) pair onto record.
+
+        Returns (sig_ok, ctx_ok) when the pair covers every field still
+        needed, or None when the record must be enriched for real.
+        """
+        cached_signal, cached_desc = pair
+        if (need_signal and not cached_signal) or (need_context and not cached_desc):
+            return None
+        if need_signal:
+            record['signal'] = cached_signal
+        if need_context:
+            record['company_description'] = cached_desc
+        return need_signal, need_context
+
+    def _process_record(
+        self,
+        idx: int,
+        record: Dict[str, str],
+        data_type: str,
+        overwrite_signal: bool,
+        generate_signal: bool,
+        generate_context: bool,
+    ) -> tuple:
+        """Enrich a single record in place.
+
+        Returns (idx, record, sig_ok, ctx_ok) — the unit of work shared by
+        the threaded and async batch drivers.
+        """
+        domain = record.get('domain', '')
+        company_name = record.get('company', '') or record.get('company_name', '')
+
+        if not domain and not company_name:
+            return idx, record, False, False
+
+        # Freemail domains and placeholder names always come back NONE —
+        # skip the full Exa+AI round-trip they would otherwise cost
+        if domain.lower() in _FREEMAIL or (
+            not domain and company_name.strip().lower() in _GARBAGE_NAMES
+        ):
+            self.skipped_no_data += 1
+            return idx, record, False, False
+
+        need_signal = generate_signal and (overwrite_signal or not record.get('signal'))
+        need_context = generate_context and not record.get('company_description')
+
+        if not need_signal and not need_context:
+            return idx, record, False, False
+
+        # Cross-batch dedupe: a company enriched earlier (this run or a
+        # previous batch) replays its (signal, description) pair when the
+        # cached pair covers everything this record still needs
+        enrich_key = f"enrich:{data_type}:{(domain or company_name).lower().strip()}"
+        cached_pair = self._cache_get(enrich_key)
+        if cached_pair is not None:
+            applied = self._apply_cached_pair(record, cached_pair, need_signal, need_context)
+            if applied is not None:
+                self.cache_hits += 1
+                return idx, record, applied[0], applied[1]
+
+        # In-flight dedupe: concurrent duplicate rows would all miss the
+        # cache before the first write lands. The first worker per key is
+        # the leader; followers wait on its future and replay the cached
+        # result instead of repeating the Exa+AI round-trips.
+        with self._inflight_lock:
+            pending = self._inflight.get(enrich_key)
+            if pending is None:
+                inflight_future: concurrent.futures.Future = concurrent.futures.Future()
+                self._inflight[enrich_key] = inflight_future
+
+        if pending is not None:
+            pending.result()
+            cached_pair = self._cache_get(enrich_key)
+            if cached_pair is not None:
+                applied = self._apply_cached_pair(record, cached_pair, need_signal, need_context)
+                if applied is not None:
+                    self.cache_hits += 1
+                    return idx, record, applied[0], applied[1]
+            # The leader just tried these exact lookups and couldn't fill
+            # the fields — repeating them would fail the same way
+            return idx, record, False, False
+
+        try:
+            return self._enrich_uncached(
+                idx, record, data_type, enrich_key,
+                need_signal, need_context,
+            )
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(enrich_key, None)
+            inflight_future.set_result(None)
+
+    def _enrich_uncached(
+        self,
+        idx: int,
+        record: Dict[str, str],
+        data_type: str,
+        enrich_key: str,
+        need_signal: bool,
+        need_context: bool,
+    ) -> tuple:
+        """Research and synthesize for a record no cache layer could serve."""
+        domain = record.get('domain', '')
+        company_name = record.get('company', '') or record.get('company_name', '')
+
+        existing_desc = record.get('company_description', '')
+        context_line = f"What they do: {existing_desc[:300]}" if existing_desc else ""
+
+        # ── Exa research ───────────────────────────────────────────────
+        if data_type == 'supply':
+            # Supply: one search — company info for both signal and context.
+            # Skip if we already have a description and don't need context.
+            if existing_desc and not need_context:
+                supply_research = ''
+            else:
+                supply_research = self._search_supply(domain, company_name)
+            demand_research = ''
+        else:
+            # Demand: one search — hiring/funding activity for both signal and context.
+            demand_research = self._search_demand(domain, company_name) if (need_signal or need_context) else ''
+            supply_research = ''
+
+        # ── Heuristic extraction before any AI call ────────────────────
+        # An unambiguous funding/hiring phrase in the research satisfies
+        # need_signal for free; the AI is only consulted for what's left
+        regex_sig = False
+        if need_signal and data_type == 'demand' and demand_research:
+            quick = _regex_extract_demand(demand_research)
+            if quick:
+                record['signal'] = quick
+                self.regex_signals += 1
+                regex_sig = True
+                need_signal = False
+                if not need_context:
+                    self._cache_set(enrich_key, (quick, ''))
+                    return idx, record, True, False
+
+        # ── Fused demand path: both fields from one JSON completion ────
+        # The demand research answers signal and description alike, so
+        # when both are needed one call replaces the signal+context pair
+        if data_type == 'demand' and need_signal and need_context and demand_research:
+            raw = self._call_ai(
+                FUSED_DEMAND_SYSTEM,
+                _render_fused_prompt(
+                    company_name or domain, domain or '', context_line, demand_research
+                ),
+                max_tokens=220,
+                json_mode=True,
+            )
+            signal, desc = self._parse_fused(raw)
+            if signal:
+                record['signal'] = signal
+            if desc:
+                record['company_description'] = desc
+            if signal or desc:
+                self._cache_set(enrich_key, (signal or '', desc or ''))
+            return idx, record, signal is not None, desc is not None
+
+        # ── Build AI prompts: (system, user) per kind ──────────────────
+        prompts: Dict[str, tuple] = {}
+
+        if need_signal:
+            if data_type == 'supply' and (supply_research or existing_desc):
+                # Use Exa results if available, fall back to context_line alone
+                research_line = f"Info found online:\n{supply_research}" if supply_research else ""
+                prompts['signal'] = (SUPPLY_SIGNAL_SYSTEM, _render_supply_prompt(
+                    company_name or domain, domain or '', context_line, research_line
+                ))
+            elif data_type == 'demand' and demand_research:
+                prompts['signal'] = (DEMAND_SIGNAL_SYSTEM, _render_demand_prompt(
+                    company_name or domain, domain or '', context_line, demand_research
+                ))
+
+        # Context uses the research appropriate for each data type — no cross-pollination
+        context_research = demand_research if data_type == 'demand' else supply_research
+        if need_context and context_research:
+            prompts['context'] = (CONTEXT_SYSTEM, _render_context_prompt(
+                company_name or domain, domain or '', context_research
+            ))
+
+        if not prompts:
+            if regex_sig:
+                self._cache_set(enrich_key, (record['signal'], ''))
+            return idx, record, regex_sig, False
+
+        # ── AI calls ───────────────────────────────────────────────────
+        # Context gets more tokens (2 sentences) vs signal (1 line <30 words).
+        # A single prompt runs inline on the current worker thread; the
+        # signal+context pair goes through the shared pool — never a
+        # per-record throwaway executor.
+        if len(prompts) == 1:
+            kind, (system, prompt) = next(iter(prompts.items()))
+            raw_outputs = {kind: self._call_ai(system, prompt, 150 if kind == 'context' else 80)}
+        else:
+            ex = self._get_executor()
+            ai_futures = {
+                kind: ex.submit(self._call_ai, system, prompt, 150 if kind == 'context' else 80)
+                for kind, (system, prompt) in prompts.items()
+            }
+            raw_outputs = {kind: future.result() for kind, future in ai_futures.items()}
+
+        sig_ok = False
+        ctx_ok = False
+        for kind, raw in raw_outputs.items():
+            if kind == 'signal':
+                signal = self._clean_signal(raw)
+                if signal:
+                    record['signal'] = signal
+                    sig_ok = True
+            elif kind == 'context':
+                if raw and raw.strip().upper() not in ('NONE', 'N/A', ''):
+                    desc = raw.strip().strip('"\'')
+                    if 10 <= len(desc) <= 500:
+                        record['company_description'] = desc
+                        ctx_ok = True
+
+        sig_ok = sig_ok or regex_sig
+
+        if sig_ok or ctx_ok:
+            self._cache_set(enrich_key, (
+                record.get('signal', '') if sig_ok else '',
+                record.get('company_description', '') if ctx_ok else '',
+            ))
+
+        return idx, record, sig_ok, ctx_ok
+
     def enrich_batch(
         self,
         records: List[Dict[str, str]],
@@ -539,103 +1233,29 @@ class ExaSignalGenerator:
         import concurrent.futures as cf
         from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
-        raw_results: list = []
         signals_out = 0
         contexts_out = 0
 
         def process_record(idx_record):
             idx, record = idx_record
-            domain = record.get('domain', '')
-            company_name = record.get('company', '') or record.get('company_name', '')
-
-            if not domain and not company_name:
-                return idx, record, False, False
-
-            need_signal = generate_signal and (overwrite_signal or not record.get('signal'))
-            need_context = generate_context and not record.get('company_description')
-
-            if not need_signal and not need_context:
-                return idx, record, False, False
-
-            existing_desc = record.get('company_description', '')
-            context_line = f"What they do: {existing_desc[:300]}" if existing_desc else ""
-
-            # ── Exa research ───────────────────────────────────────────────
-            if data_type == 'supply':
-                # Supply: one search — company info for both signal and context.
-                # Skip if we already have a description and don't need context.
-                if existing_desc and not need_context:
-                    supply_research = ''
-                else:
-                    supply_research = self._search_supply(domain, company_name)
-                demand_research = ''
-            else:
-                # Demand: one search — hiring/funding activity for both signal and context.
-                demand_research = self._search_demand(domain, company_name) if (need_signal or need_context) else ''
-                supply_research = ''
-
-            # ── Build AI prompts ───────────────────────────────────────────
-            prompts: Dict[str, str] = {}
-
-            if need_signal:
-                if data_type == 'supply' and (supply_research or existing_desc):
-                    # Use Exa results if available, fall back to context_line alone
-                    research_line = f"Info found online:\n{supply_research}" if supply_research else ""
-                    prompts['signal'] = SUPPLY_SIGNAL_PROMPT.format(
-                        company_name=company_name or domain,
-                        domain=domain or '',
-                        context_line=context_line,
-                        research_line=research_line,
-                    )
-                elif data_type == 'demand' and demand_research:
-                    prompts['signal'] = DEMAND_SIGNAL_PROMPT.format(
-                        company_name=company_name or domain,
-                        domain=domain or '',
-                        context_line=context_line,
-                        research=demand_research,
-                    )
-
-            # Context uses the research appropriate for each data type — no cross-pollination
-            context_research = demand_research if data_type == 'demand' else supply_research
-            if need_context and context_research:
-                prompts['context'] = CONTEXT_PROMPT.format(
-                    company_name=company_name or domain,
-                    domain=domain or '',
-                    research=context_research,
-                )
+            return self._process_record(
+                idx, record, data_type,
+                overwrite_signal, generate_signal, generate_context,
+            )
 
-            if not prompts:
-                return idx, record, False, False
-
-            # ── Parallel AI calls ──────────────────────────────────────────
-            # Context gets more tokens (2 sentences) vs signal (1 line <30 words)
-            sig_ok = False
-            ctx_ok = False
-            with cf.ThreadPoolExecutor(max_workers=len(prompts)) as ex:
-                ai_futures = {
-                    kind: ex.submit(self._call_ai, prompt, 150 if kind == 'context' else 80)
-                    for kind, prompt in prompts.items()
-                }
-                for kind, future in ai_futures.items():
-                    raw = future.result()
-                    if kind == 'signal':
-                        signal = self._clean_signal(raw)
-                        if signal:
-                            record['signal'] = signal
-                            sig_ok = True
-                    elif kind == 'context':
-                        if raw and raw.strip().upper() not in ('NONE', 'N/A', ''):
-                            desc = raw.strip().strip('"\'')
-                            if 10 <= len(desc) <= 500:
-                                record['company_description'] = desc
-                                ctx_ok = True
-
-            return idx, record, sig_ok, ctx_ok
 
         indexed_records = list(enumerate(records))
 
         total = len(records)
 
+        # Completion order is arbitrary, so slot each record straight into
+        # its final position — no post-hoc sort over the whole batch
+        ordered_records: List[Dict[str, str]] = [None] * total  # type: ignore[list-item]
+
+        # The token bucket paces AI calls, so the pool no longer doubles as
+        # a rate limiter — it just needs enough threads to cover network wait
+        max_workers = int(os.getenv('ENRICH_MAX_WORKERS', '20'))
+
         if show_progress:
             with Progress(
                 SpinnerColumn(),
@@ -646,7 +1266,7 @@ class ExaSignalGenerator:
             ) as progress:
                 task = progress.add_task("[cyan]Enriching with Exa...", total=total)
 
-                with cf.ThreadPoolExecutor(max_workers=10) as executor:
+                with cf.ThreadPoolExecutor(max_workers=max_workers) as executor:
                     future_map = {
                         executor.submit(process_record, item): item
                         for item in indexed_records
@@ -664,7 +1284,7 @@ class ExaSignalGenerator:
                             self.signals_generated += 1
                         if ctx_ok:
                             contexts_out += 1
-                        raw_results.append((idx, record))
+                        ordered_records[idx] = record
 
                         result_parts = []
                         if sig_ok: result_parts.append("signal ☉")
@@ -673,7 +1293,7 @@ class ExaSignalGenerator:
                         desc = f"[cyan]{company[:30]}[/cyan][dim]{result_str}[/dim]" if company else "[cyan]Enriching...[/cyan]"
                         progress.update(task, description=desc, advance=1)
         else:
-            with cf.ThreadPoolExecutor(max_workers=10) as executor:
+            with cf.ThreadPoolExecutor(max_workers=max_workers) as executor:
                 future_map = {
                     executor.submit(process_record, item): item
                     for item in indexed_records
@@ -685,10 +1305,7 @@ class ExaSignalGenerator:
                         self.signals_generated += 1
                     if ctx_ok:
                         contexts_out += 1
-                    raw_results.append((idx, record))
-
-        raw_results.sort(key=lambda x: x[0])
-        ordered_records = [r for _, r in raw_results]
+                    ordered_records[idx] = record
 
         sig_pct  = f"{signals_out  / total * 100:.0f}%" if total else "0%"
         ctx_pct  = f"{contexts_out / total * 100:.0f}%" if total else "0%"
@@ -699,6 +1316,121 @@ class ExaSignalGenerator:
 
         return ordered_records
 
+    def enrich_batch_iter(
+        self,
+        records_iter: Iterable[Dict[str, str]],
+        data_type: str = 'demand',
+        overwrite_signal: bool = False,
+        generate_signal: bool = True,
+        generate_context: bool = True,
+        window: int = 500,
+    ) -> Iterator[Dict[str, str]]:
+        """Streaming variant of enrich_batch for very large inputs.
+
+        enrich_batch materializes the whole batch plus one future per row
+        up front — fine for normal runs, an OOM risk at 100K rows. This
+        keeps at most `window` records in flight and yields enriched
+        records in input order as they complete, so huge CSVs can stream
+        straight through to a downstream writer in constant memory. The
+        worker pool stays saturated as long as window exceeds it.
+        """
+        import concurrent.futures as cf
+        import heapq
+
+        max_workers = int(os.getenv('ENRICH_MAX_WORKERS', '20'))
+        source = enumerate(records_iter)
+        # Completed out-of-order results park here until their turn; bounded
+        # by window (everything in flight could finish before the oldest row)
+        ready: list = []
+        next_idx = 0
+        exhausted = False
+
+        with cf.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: set = set()
+
+            while True:
+                while not exhausted and len(pending) < window:
+                    try:
+                        idx, record = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    pending.add(executor.submit(
+                        self._process_record, idx, record, data_type,
+                        overwrite_signal, generate_signal, generate_context,
+                    ))
+
+                if not pending:
+                    break
+
+                done, pending = cf.wait(pending, return_when=cf.FIRST_COMPLETED)
+                for future in done:
+                    idx, record, sig_ok, _ctx_ok = future.result()
+                    if sig_ok:
+                        self.signals_generated += 1
+                    heapq.heappush(ready, (idx, record))
+
+                # idx is unique, so the heap never compares record dicts
+                while ready and ready[0][0] == next_idx:
+                    yield heapq.heappop(ready)[1]
+                    next_idx += 1
+
+        while ready:
+            yield heapq.heappop(ready)[1]
+
+    async def enrich_batch_async(
+        self,
+        records: List[Dict[str, str]],
+        data_type: str = 'demand',
+        overwrite_signal: bool = False,
+        generate_signal: bool = True,
+        generate_context: bool = True,
+        max_concurrency: int = 20,
+    ) -> List[Dict[str, str]]:
+        """
+        Async variant of enrich_batch for callers already inside an event loop.
+
+        The Exa and AI SDKs we drive are synchronous, so each record runs
+        _process_record on a thread pool via run_in_executor; the semaphore
+        bounds in-flight records and gather(return_exceptions=True) keeps
+        one failed record from sinking the batch.
+
+        Outer records get their own local pool (like enrich_batch's), NOT
+        the shared executor: _process_record submits nested Exa/AI futures
+        to the shared pool and blocks on them, so outer tasks parked there
+        too could fill every worker and deadlock waiting on nested work
+        that can never be scheduled.
+        """
+        import concurrent.futures as cf
+
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        with cf.ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+
+            async def enrich_one(idx, record):
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        executor, self._process_record,
+                        idx, record, data_type,
+                        overwrite_signal, generate_signal, generate_context,
+                    )
+
+            results = await asyncio.gather(
+                *[enrich_one(idx, record) for idx, record in enumerate(records)],
+                return_exceptions=True,
+            )
+
+        for result in results:
+            if isinstance(result, BaseException):
+                err = f"Enrich error: {type(result).__name__}: {result}"
+                if err not in self._errors:
+                    self._errors.append(err)
+            elif result[2]:
+                self.signals_generated += 1
+
+        return records
+
     def get_stats(self) -> Dict[str, int]:
         """Get generation statistics."""
         return {
@@ -708,6 +1440,8 @@ class ExaSignalGenerator:
             'signals_generated': self.signals_generated,
             'skipped_no_data': self.skipped_no_data,
             'failed': self.failed,
+            'cache_read_tokens': self.cache_read_tokens,
+            'regex_signals': self.regex_signals,
         }
 
     def get_errors(self) -> List[str]:
@@ -7,8 +7,14 @@ Handles:
 - Signal text formatting
 """
 
+import sys
 from typing import Optional
 
+# Prefix endings that already read as separators — only a space is added
+# after them. Last-char set membership is one hash probe, where
+# endswith(tuple) iterates the alternatives.
+_PREFIX_PUNCT = frozenset(':!-')
+
 
 def apply_signal(
     row_signal: Optional[str],
@@ -41,23 +47,27 @@ def apply_signal(
         >>> apply_signal("", "needs deal flow", None)
         "needs deal flow"
     """
+    # Both inputs empty — the common case in sparse exports — needs no
+    # strips, no prefix logic, nothing
+    if not global_signal and not row_signal:
+        return ""
+
     # Step 1: Choose signal based on precedence (GLOBAL FIRST!)
-    signal = ""
-    if global_signal and global_signal.strip():
-        # Global signal overrides everything when provided
-        signal = global_signal.strip()
-    elif row_signal and row_signal.strip():
-        # Use row signal only if no global signal
-        signal = row_signal.strip()
+    # Short-circuiting `or` encodes the precedence chain in one expression:
+    # a truthy stripped global wins, otherwise the stripped row signal,
+    # otherwise "" — same branches, fewer loads and jumps per call
+    signal = (global_signal or "").strip() or (row_signal or "").strip()
 
     # Step 2: Apply prefix if provided
     if signal_prefix and signal:
         prefix = signal_prefix.rstrip()
-        # Always ensure exactly one space between prefix and signal
-        if prefix.endswith((':', '!', '-')):
-            signal = f"{prefix} {signal}"
+        # Always ensure exactly one space between prefix and signal.
+        # Plain + beats an f-string here: two known-str operands need no
+        # FORMAT_VALUE/BUILD_STRING machinery per call.
+        if prefix and prefix[-1] in _PREFIX_PUNCT:
+            signal = prefix + ' ' + signal
         else:
-            signal = f"{prefix}: {signal}"
+            signal = prefix + ': ' + signal
 
     return signal
 
@@ -76,6 +86,14 @@ class SignalProcessor:
             record['signal'] = processor.process(record.get('signal'))
     """
 
+    # Slots: instances are long-lived hot objects — no per-instance
+    # __dict__, and attribute loads in process() become fixed-offset
+    # reads instead of hash probes
+    __slots__ = (
+        'global_signal', 'signal_prefix',
+        '_global', '_prefix_full', '_constant', '_memo',
+    )
+
     def __init__(
         self,
         global_signal: Optional[str] = None,
@@ -91,6 +109,33 @@ class SignalProcessor:
         self.global_signal = global_signal
         self.signal_prefix = signal_prefix
 
+        # Everything apply_signal derives from the global signal and prefix
+        # is invariant across a batch — strip them and settle the prefix
+        # punctuation once here instead of once per row.
+        stripped = global_signal.strip() if global_signal else ''
+        self._global: Optional[str] = stripped or None
+        if signal_prefix:
+            prefix = signal_prefix.rstrip()
+            self._prefix_full = prefix + (' ' if prefix and prefix[-1] in _PREFIX_PUNCT else ': ')
+        else:
+            self._prefix_full = ''
+        # A global signal overrides every row, so the output is one constant
+        # string computed here — per-row work collapses to returning it.
+        # Interned: every record holds the same object, so downstream
+        # equality checks short-circuit on identity.
+        self._constant: Optional[str] = (
+            sys.intern(self._prefix_full + self._global)
+            if self._global is not None else None
+        )
+
+        # Row signals are heavily skewed in real exports (a few dozen
+        # distinct strings across thousands of rows), so each distinct
+        # input pays the strip+concat exactly once. Bounded by _MEMO_MAX
+        # in case a batch really does have per-row unique signals.
+        self._memo: dict = {}
+
+    _MEMO_MAX = 4096
+
     def process(self, row_signal: Optional[str]) -> str:
         """
         Process a single row's signal.
@@ -101,7 +146,17 @@ class SignalProcessor:
         Returns:
             Processed signal with prefix applied
         """
-        return apply_signal(row_signal, self.global_signal, self.signal_prefix)
+        if self._constant is not None:
+            return self._constant
+        memo = self._memo
+        cached = memo.get(row_signal)
+        if cached is not None:
+            return cached
+        signal = row_signal.strip() if row_signal else ''
+        result = self._prefix_full + signal if signal else ''
+        if len(memo) < self._MEMO_MAX:
+            memo[row_signal] = result
+        return result
 
     def process_batch(self, records: list, signal_field: str = 'signal') -> list:
         """
@@ -113,13 +168,63 @@ class SignalProcessor:
 
         Returns:
             Records with processed signals (modifies in place)
+
+        Note:
+            This stays row-oriented on purpose: the whole pipeline moves
+            list-of-dict records, and with the precomputed constant path
+            above the per-row cost is a dict store — a columnar detour
+            (Arrow/pandas) would add a dependency and two conversions to
+            vectorize work that is no longer the bottleneck.
         """
-        for record in records:
-            row_signal = record.get(signal_field)
-            record[signal_field] = self.process(row_signal)
+        if self._constant is not None:
+            # Global signal set: every row gets the same precomputed string
+            constant = self._constant
+            for record in records:
+                record[signal_field] = constant
+            return records
+
+        process = self.process
+        remainder = records
+
+        if records and signal_field in records[0]:
+            # CSV-sourced batches have uniform columns, so plain
+            # subscripting beats a bound dict.get call per row. A ragged
+            # batch raises before the odd row is written, so the tolerant
+            # loop below picks up exactly where this one stopped.
+            try:
+                for i, record in enumerate(records):
+                    record[signal_field] = process(record[signal_field])
+                return records
+            except KeyError:
+                remainder = records[i:]
+
+        for record in remainder:
+            record[signal_field] = process(record.get(signal_field))
 
         return records
 
+    def process_column(self, values: list) -> list:
+        """
+        Process a bare signal column (list of values) into a new list.
+
+        For callers that keep columns rather than record dicts — avoids
+        building throwaway dicts just to call process_batch. The listcomp
+        runs on CPython's LIST_APPEND fast path; dict-record callers
+        should stay with process_batch, which writes in place without an
+        extract-and-zip round trip.
+
+        Args:
+            values: List of raw signal values
+
+        Returns:
+            New list of processed signals, same order
+        """
+        if self._constant is not None:
+            return [self._constant] * len(values)
+
+        process = self.process
+        return [process(v) for v in values]
+
     def get_stats(self, records: list, signal_field: str = 'signal') -> dict:
         """
         Get statistics about signal sources.
@@ -131,13 +236,17 @@ class SignalProcessor:
         Returns:
             Dict with counts of row signals vs global signals
         """
+        # Single pass with a plain loop: the genexpr + sum() version walked
+        # the list through an extra generator frame per element
         total = len(records)
-        empty = sum(1 for r in records if not r.get(signal_field))
-        has_signal = total - empty
+        has_signal = 0
+        for r in records:
+            if r.get(signal_field):
+                has_signal += 1
 
         return {
             'total': total,
             'with_signal': has_signal,
-            'empty': empty,
+            'empty': total - has_signal,
             'fill_rate': (has_signal / total * 100) if total > 0 else 0
         }